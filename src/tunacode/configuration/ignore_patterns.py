@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
 from pathlib import Path
 from typing import Final
 
 import pathspec
+from pathspec.pattern import RegexPattern
 
 from tunacode.constants import ENV_FILE
 
@@ -69,6 +71,10 @@ DEFAULT_IGNORE_PATTERNS: Final[tuple[str, ...]] = (
 
 _WILDCARD_CHARS = ("*", "?", "[")
 
+# pathspec tags directory matches with a named group; repeating it across an
+# alternation is illegal, so combined regexes demote it to a plain group.
+_NAMED_GROUP_PATTERN = re.compile(r"\(\?P<[^>]+>")
+
 DEFAULT_EXCLUDE_DIRS: Final[frozenset[str]] = frozenset(
     p.rstrip("/")
     for p in DEFAULT_IGNORE_PATTERNS
@@ -89,6 +95,29 @@ def compile_ignore_spec(patterns: Iterable[str]) -> pathspec.PathSpec:
     return pathspec.PathSpec.from_lines("gitwildmatch", patterns)
 
 
+def compile_ignore_regex(spec: pathspec.PathSpec) -> re.Pattern[str] | None:
+    """Fold an include-only spec into one regex so a path is matched in a single scan.
+
+    Returns None when the spec has negated patterns, whose last-match-wins
+    ordering an alternation cannot express, or patterns without a compiled
+    regex; callers fall back to the spec.
+    """
+    regexes: list[str] = []
+    for pattern in spec.patterns:
+        if pattern.include is None:
+            continue
+        if not pattern.include or not isinstance(pattern, RegexPattern):
+            return None
+        compiled = pattern.regex
+        if compiled is None:
+            return None
+        regexes.append(_NAMED_GROUP_PATTERN.sub("(?:", compiled.pattern))
+
+    if not regexes:
+        return None
+    return re.compile("|".join(f"(?:{regex})" for regex in regexes))
+
+
 def merge_ignore_patterns(
     base_patterns: Iterable[str],
     extra_patterns: Iterable[str],
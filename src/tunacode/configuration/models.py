@@ -4,7 +4,7 @@ Module: tunacode.configuration.models
 Configuration for loading model data from models_registry.json.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import cast
 
 from tunacode.constants import DEFAULT_CONTEXT_WINDOW, MODEL_PICKER_UNFILTERED_LIMIT
@@ -31,6 +31,17 @@ class ModelPickerEntry:
     provider_name: str
     model_id: str
     model_name: str
+    # Lowercased once at construction; the picker filters and sorts on every keystroke.
+    search_text: str = field(init=False, repr=False, compare=False)
+    sort_key: tuple[str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "search_text", _build_model_search_text(self))
+        object.__setattr__(
+            self,
+            "sort_key",
+            (self.model_name.lower(), self.provider_name.lower(), self.model_id.lower()),
+        )
 
 
 def _build_model_search_text(entry: ModelPickerEntry) -> str:
@@ -45,12 +56,8 @@ def _build_model_search_text(entry: ModelPickerEntry) -> str:
     ).lower()
 
 
-def _matches_model_query(entry: ModelPickerEntry, normalized_query: str) -> bool:
-    query_tokens = normalized_query.split()
-    if not query_tokens:
-        return True
-
-    search_text = _build_model_search_text(entry)
+def _matches_model_query(entry: ModelPickerEntry, query_tokens: list[str]) -> bool:
+    search_text = entry.search_text
     return all(token in search_text for token in query_tokens)
 
 
@@ -176,14 +183,7 @@ def get_model_picker_entries() -> list[ModelPickerEntry]:
                 )
             )
 
-    return sorted(
-        entries,
-        key=lambda entry: (
-            entry.model_name.lower(),
-            entry.provider_name.lower(),
-            entry.model_id.lower(),
-        ),
-    )
+    return sorted(entries, key=lambda entry: entry.sort_key)
 
 
 def rank_model_picker_entries(
@@ -195,13 +195,13 @@ def rank_model_picker_entries(
     limit: int = MODEL_PICKER_UNFILTERED_LIMIT,
 ) -> tuple[list[ModelPickerEntry], bool]:
     """Rank model entries for the picker and report unfiltered truncation."""
-    normalized_query = filter_query.strip().lower()
-    has_query = bool(normalized_query)
+    query_tokens = filter_query.lower().split()
+    has_query = bool(query_tokens)
     recent_order = {model_name: index for index, model_name in enumerate(recent_models)}
     matching_entries: list[ModelPickerEntry] = []
 
     for entry in entries:
-        if has_query and not _matches_model_query(entry, normalized_query):
+        if has_query and not _matches_model_query(entry, query_tokens):
             continue
         matching_entries.append(entry)
 
@@ -215,9 +215,7 @@ def rank_model_picker_entries(
                 else 2
             ),
             recent_order.get(entry.full_model, limit),
-            entry.model_name.lower(),
-            entry.provider_name.lower(),
-            entry.model_id.lower(),
+            *entry.sort_key,
         )
     )
 
@@ -8,6 +8,8 @@ from tunacode.configuration.models import (
 )
 from tunacode.types import ModelPricing
 
+from tunacode.infrastructure.cache.caches import model_pricing as model_pricing_cache
+
 TOKENS_PER_MILLION = 1_000_000
 
 
@@ -21,6 +23,16 @@ def get_model_pricing(model_string: str) -> ModelPricing | None:
         ModelPricing with input/output/cached costs per million tokens,
         or None if model not found or has no pricing data.
     """
+    hit, cached = model_pricing_cache.try_get_model_pricing(model_string)
+    if hit:
+        return cached
+
+    pricing = _lookup_model_pricing(model_string)
+    model_pricing_cache.set_model_pricing(model_string, pricing)
+    return pricing
+
+
+def _lookup_model_pricing(model_string: str) -> ModelPricing | None:
     try:
         provider_id, model_id = parse_model_string(model_string)
     except ValueError:
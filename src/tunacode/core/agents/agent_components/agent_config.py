@@ -54,6 +54,7 @@ from tunacode.tools.web_fetch import web_fetch
 from tunacode.tools.write_file import write_file
 
 from tunacode.infrastructure.cache.caches import agents as agents_cache
+from tunacode.infrastructure.cache.caches import system_prompt as system_prompt_cache
 from tunacode.infrastructure.cache.caches import tunacode_context as context_cache
 
 from tunacode.core.compaction.controller import get_or_create_compaction_controller
@@ -84,6 +85,8 @@ __all__ = [
     "_coerce_max_iterations",
 ]
 
+TUNACODE_PACKAGE_PATH = Path(__file__).parents[3]
+_SESSION_AGENT_MISSING = object()
 ENV_OPENAI_API_KEY = "OPENAI_API_KEY"
 OPENAI_CHAT_COMPLETIONS_PATH = "/chat/completions"
 OPENROUTER_PROVIDER_ID = "openrouter"
@@ -168,12 +171,10 @@ def invalidate_agent_cache(model: str, state_manager: StateManagerProtocol) -> b
     """Invalidate cached agent for a specific model."""
     logger = get_logger()
     cleared_module = agents_cache.invalidate_agent(model)
-    cleared_session = False
 
     session_agents = _session_agents_dict(state_manager.session)
-    if model in session_agents:
-        del session_agents[model]
-        cleared_session = True
+    removed_agent = session_agents.pop(model, _SESSION_AGENT_MISSING)
+    cleared_session = removed_agent is not _SESSION_AGENT_MISSING
     state_manager.session.agent_versions.pop(model, None)
 
     invalidated = cleared_module or cleared_session
@@ -191,9 +192,14 @@ def load_system_prompt(
 ) -> str:
     _ = model
     prompt_file = base_path / "prompts" / "system_prompt.md"
+    cached = system_prompt_cache.get_system_prompt(prompt_file)
+    if cached is not None:
+        return cached
     if not prompt_file.exists():
         raise FileNotFoundError(f"Required prompt file not found: {prompt_file}")
-    return prompt_file.read_text(encoding="utf-8")
+    content = prompt_file.read_text(encoding="utf-8")
+    system_prompt_cache.set_system_prompt(prompt_file, content)
+    return content
 
 
 def load_tunacode_context() -> str:
@@ -242,17 +248,24 @@ def _apply_tool_concurrency_limit(
     return [_wrap_tool_with_concurrency_limit(tool, limiter=limiter) for tool in tools]
 
 
+# Wrapping mutates each tool's execute handler, so it must happen exactly once per process.
+_CONCURRENCY_LIMITED_TOOLS: tuple[AgentTool, ...] = tuple(
+    _apply_tool_concurrency_limit(
+        [
+            bash,
+            discover,
+            read_file,
+            hashline_edit,
+            web_fetch,
+            write_file,
+        ]
+    )
+)
+
+
 def _build_tools(*, strict_validation: bool = False) -> list[AgentTool]:
     _ = strict_validation
-    tools: list[AgentTool] = [
-        bash,
-        discover,
-        read_file,
-        hashline_edit,
-        web_fetch,
-        write_file,
-    ]
-    return _apply_tool_concurrency_limit(tools)
+    return list(_CONCURRENCY_LIMITED_TOOLS)
 
 
 def _normalize_chat_completions_url(base_url: str | None) -> str | None:
@@ -291,20 +304,16 @@ def _build_api_key_resolver(
 ) -> Callable[[str], str | None]:
     if isinstance(env_config, Mapping):
 
-        def env_getter() -> Mapping[str, str]:
-            return env_config
+        def configured_value(env_var: str) -> object:
+            return env_config.get(env_var)
     else:
         session = env_config
 
-        def env_getter() -> Mapping[str, str]:
-            return {
-                key: value.strip()
-                for key, value in session.user_config["env"].items()
-                if value.strip()
-            }
+        def configured_value(env_var: str) -> object:
+            return session.user_config["env"].get(env_var)
 
     def _read_api_key(env_var: str) -> str | None:
-        configured = env_getter().get(env_var)
+        configured = configured_value(env_var)
         if isinstance(configured, str) and configured.strip():
             return configured.strip()
         os_value = os.environ.get(env_var, "")
@@ -366,6 +375,7 @@ def _build_stream_fn(
     ) -> StreamResponse:
         stream_options = _merge_stream_options(options=options, max_tokens=max_tokens)
         logger = get_logger()
+        debug_mode = logger.debug_mode
 
         for attempt in range(1, max_retries + 1):
             if request_delay > 0:
@@ -374,12 +384,12 @@ def _build_stream_fn(
                 opened_at = time.perf_counter()
                 response = await stream_alchemy_openai_completions(model, context, stream_options)
                 response_ready_at = time.perf_counter()
-                logger.lifecycle(
-                    "Stream: "
-                    f"provider_open attempt={attempt}/{max_retries} "
-                    f"dur={(response_ready_at - opened_at) * 1000.0:.1f}ms"
-                )
-                if logger.debug_mode:
+                if debug_mode:
+                    logger.lifecycle(
+                        "Stream: "
+                        f"provider_open attempt={attempt}/{max_retries} "
+                        f"dur={(response_ready_at - opened_at) * 1000.0:.1f}ms"
+                    )
                     return _TracedStreamResponse(
                         response,
                         logger=cast(_LifecycleTraceLogger, logger),
@@ -467,10 +477,9 @@ def _build_skills_prompt_state(session: SessionStateProtocol) -> SkillsPromptSta
     )
 
     return SkillsPromptState(
-        available_block=render_available_skills_block(available_skill_summaries),
-        selected_block=render_selected_skills_block(selected_skills),
-        fingerprint=compute_skills_prompt_fingerprint(available_skill_summaries, selected_skills),
+        available_skill_summaries=available_skill_summaries,
         selected_skills=selected_skills,
+        fingerprint=compute_skills_prompt_fingerprint(available_skill_summaries, selected_skills),
     )
 
 
@@ -522,7 +531,8 @@ def get_or_create_agent(model: ModelName, state_manager: StateManagerProtocol) -
     init_started_at = time.perf_counter()
     registry_cached = get_cached_models_registry() is not None  # type: ignore[misc]
     registry_started_at = time.perf_counter()
-    load_models_registry()
+    if not registry_cached:
+        load_models_registry()
     registry_duration_ms = (time.perf_counter() - registry_started_at) * 1000.0
     logger.lifecycle(
         "Init: "
@@ -556,14 +566,15 @@ def get_or_create_agent(model: ModelName, state_manager: StateManagerProtocol) -
         del session_agents[model]
         session.agent_versions.pop(model, None)
 
-    base_path = Path(__file__).parent.parent.parent.parent
-    system_prompt_content = load_system_prompt(base_path, model=model)
+    system_prompt_content = load_system_prompt(TUNACODE_PACKAGE_PATH, model=model)
     tunacode_context_content = load_tunacode_context()
-    system_prompt = (
-        system_prompt_content
-        + tunacode_context_content
-        + skills_state.selected_block
-        + skills_state.available_block
+    system_prompt = "".join(
+        (
+            system_prompt_content,
+            tunacode_context_content,
+            render_selected_skills_block(skills_state.selected_skills),
+            render_available_skills_block(skills_state.available_skill_summaries),
+        )
     )
 
     tools = _build_tools(strict_validation=config.settings.tool_strict_validation)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 
 RECENT_TOOL_LIMIT = 3
 
@@ -10,12 +10,29 @@ ToolArgsView = Mapping[str, object]
 ToolCallView = Mapping[str, object]
 
 
+def _read_file_path(tool_args: ToolArgsView) -> str:
+    key = "file_path" if "file_path" in tool_args else "filepath"
+    path_value = tool_args.get(key, "")
+    return path_value if isinstance(path_value, str) else ""
+
+
 def _describe_read_file(tool_args: ToolArgsView) -> str:
-    path_value = tool_args.get("file_path", tool_args.get("filepath", ""))
-    path = path_value if isinstance(path_value, str) else ""
+    path = _read_file_path(tool_args)
     return f"Reading `{path}`" if path else "Reading file"
 
 
+def _summarize_read_file(tool_args: ToolArgsView) -> str:
+    return f"read_file('{_read_file_path(tool_args)}')"
+
+
+_TOOL_DESCRIPTIONS: dict[str, Callable[[ToolArgsView], str]] = {
+    "read_file": _summarize_read_file,
+}
+_READABLE_TOOL_DESCRIPTIONS: dict[str, Callable[[ToolArgsView], str]] = {
+    "read_file": _describe_read_file,
+}
+
+
 def _coerce_tool_args(value: object) -> ToolArgsView:
     if not isinstance(value, dict):
         raise TypeError(f"tool args must be a dict[str, object], got {type(value).__name__}")
@@ -30,18 +47,18 @@ def _coerce_tool_args(value: object) -> ToolArgsView:
 
 def get_tool_description(tool_name: str, tool_args: ToolArgsView) -> str:
     """Get a descriptive string for a tool call."""
-    if tool_name != "read_file":
+    describe = _TOOL_DESCRIPTIONS.get(tool_name)
+    if describe is None:
         return tool_name
-    path_value = tool_args.get("file_path", tool_args.get("filepath", ""))
-    path = path_value if isinstance(path_value, str) else ""
-    return f"{tool_name}('{path}')"
+    return describe(tool_args)
 
 
 def get_readable_tool_description(tool_name: str, tool_args: ToolArgsView) -> str:
     """Get a human-readable description of a tool operation for batch panel display."""
-    if tool_name == "read_file":
-        return _describe_read_file(tool_args)
-    return f"Executing `{tool_name}`"
+    describe = _READABLE_TOOL_DESCRIPTIONS.get(tool_name)
+    if describe is None:
+        return f"Executing `{tool_name}`"
+    return describe(tool_args)
 
 
 def get_recent_tools_context(tool_calls: list[ToolCallView], limit: int = RECENT_TOOL_LIMIT) -> str:
@@ -49,11 +66,11 @@ def get_recent_tools_context(tool_calls: list[ToolCallView], limit: int = RECENT
     if not tool_calls:
         return "No tools used yet"
 
-    recent_descriptions = [
+    recent_descriptions = ", ".join(
         get_tool_description(
             str(tool_call.get("tool", "")),
             _coerce_tool_args(tool_call.get("args", {})),
         )
         for tool_call in tool_calls[-limit:]
-    ]
-    return f"Recent tools: {', '.join(recent_descriptions)}"
+    )
+    return f"Recent tools: {recent_descriptions}"
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from tunacode.skills.models import SelectedSkill
+from tunacode.skills.models import SelectedSkill, SkillSummary
+from tunacode.types import UserSettings
 from tunacode.core.types.state import SessionStateProtocol
 
 
@@ -27,36 +28,51 @@ class SessionConfig:
 
 @dataclass(frozen=True, slots=True)
 class SkillsPromptState:
-    available_block: str
-    selected_block: str
-    fingerprint: str
+    available_skill_summaries: list[SkillSummary]
     selected_skills: list[SelectedSkill]
+    fingerprint: str
 
 
-def _normalize_session_config(session: SessionStateProtocol) -> SessionConfig:
-    user_config = session.user_config
-    raw_settings = user_config["settings"]
+def _read_request_delay(raw_settings: UserSettings) -> float:
     request_delay = raw_settings["request_delay"]
     if request_delay < 0.0 or request_delay > 60.0:
         raise ValueError(f"request_delay must be between 0.0 and 60.0 seconds, got {request_delay}")
+    return request_delay
+
 
+def _read_global_request_timeout(raw_settings: UserSettings) -> float | None:
     timeout = raw_settings["global_request_timeout"]
     if timeout < 0.0:
         raise ValueError(f"global_request_timeout must be >= 0.0 seconds, got {timeout}")
+    return None if timeout == 0.0 else timeout
+
+
+def _read_max_iterations(raw_settings: UserSettings) -> int:
+    max_iterations = raw_settings["max_iterations"]
+    if max_iterations < 1:
+        raise ValueError(f"max_iterations must be >= 1, got {max_iterations}")
+    return max_iterations
+
+
+def _normalize_session_config(session: SessionStateProtocol) -> SessionConfig:
+    user_config = session.user_config
+    raw_settings = user_config["settings"]
+    request_delay = _read_request_delay(raw_settings)
+    global_request_timeout = _read_global_request_timeout(raw_settings)
 
     env_config = {key: value.strip() for key, value in user_config["env"].items() if value.strip()}
 
+    max_retries = raw_settings["max_retries"]
+    if max_retries < 1:
+        raise ValueError(f"max_retries must be >= 1, got {max_retries}")
+
     settings = AgentSettings(
         request_delay=request_delay,
-        global_request_timeout=None if timeout == 0.0 else timeout,
-        max_retries=raw_settings["max_retries"],
+        global_request_timeout=global_request_timeout,
+        max_retries=max_retries,
         tool_strict_validation=raw_settings["tool_strict_validation"],
-        max_iterations=raw_settings["max_iterations"],
+        max_iterations=_read_max_iterations(raw_settings),
     )
-    if settings.max_retries < 1:
-        raise ValueError(f"max_retries must be >= 1, got {settings.max_retries}")
-    if settings.max_iterations < 1:
-        raise ValueError(f"max_iterations must be >= 1, got {settings.max_iterations}")
     return SessionConfig(settings=settings, env=env_config)
 
 
@@ -66,16 +82,18 @@ def _coerce_session_config(config: SessionConfig | SessionStateProtocol) -> Sess
     return _normalize_session_config(config)
 
 
+# Single-setting readers skip building the full SessionConfig (env copy included);
+# _coerce_max_iterations runs after every agent turn.
 def _coerce_request_delay(session: SessionStateProtocol) -> float:
-    return _normalize_session_config(session).settings.request_delay
+    return _read_request_delay(session.user_config["settings"])
 
 
 def _coerce_global_request_timeout(session: SessionStateProtocol) -> float | None:
-    return _normalize_session_config(session).settings.global_request_timeout
+    return _read_global_request_timeout(session.user_config["settings"])
 
 
 def _coerce_max_iterations(session: SessionStateProtocol) -> int:
-    return _normalize_session_config(session).settings.max_iterations
+    return _read_max_iterations(session.user_config["settings"])
 
 
 def _compute_agent_version(
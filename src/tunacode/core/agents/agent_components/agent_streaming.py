@@ -11,6 +11,7 @@ from tinyagent.agent import Agent, extract_text
 from tinyagent.agent_types import (
     AgentEndEvent,
     AgentEvent,
+    AgentMessage,
     AssistantMessage,
     MessageEndEvent,
     MessageUpdateEvent,
@@ -52,6 +53,17 @@ if TYPE_CHECKING:
 _MS_PER_S = 1000
 
 
+def _shares_message_prefix(
+    messages: list[AgentMessage],
+    previous_messages: list[AgentMessage],
+    count: int,
+) -> bool:
+    """Return True when the first ``count`` messages are the same objects in both lists."""
+    if count > len(messages) or count > len(previous_messages):
+        return False
+    return all(messages[index] is previous_messages[index] for index in range(count))
+
+
 class AgentStreamMixin:
     """Stream loop + event dispatch; expects orchestrator attributes and _agent_error_text."""
 
@@ -71,7 +83,9 @@ class AgentStreamMixin:
         self, state: _TinyAgentStreamState, *, tool_call_id: str
     ) -> None:
         if state.active_tool_call_ids:
-            state.batch_tool_call_ids.update(state.active_tool_call_ids)
+            # Active ids join the batch once when it opens; later starts only add themselves.
+            if not state.batch_tool_call_ids:
+                state.batch_tool_call_ids.update(state.active_tool_call_ids)
             state.batch_tool_call_ids.add(tool_call_id)
         state.active_tool_call_ids.add(tool_call_id)
 
@@ -92,16 +106,22 @@ class AgentStreamMixin:
 
     def _persist_agent_messages(self, agent: Agent, baseline_message_count: int) -> None:
         conversation = self.state_manager.session.conversation
-        external_messages = list(conversation.messages[baseline_message_count:])
-        conversation.messages = [*list(agent.state.messages), *external_messages]
+        previous_messages = conversation.messages
+        agent_messages = agent.state.messages
+        external_messages = previous_messages[baseline_message_count:]
+        conversation.messages = [*agent_messages, *external_messages]
+        if _shares_message_prefix(agent_messages, previous_messages, baseline_message_count):
+            # total_tokens already covers the shared prefix and the external tail.
+            new_messages = agent_messages[baseline_message_count:]
+            conversation.total_tokens += estimate_messages_tokens(new_messages)
+            return
         conversation.total_tokens = estimate_messages_tokens(conversation.messages)
 
     def _append_interrupted_partial_message(self) -> None:
-        from tinyagent.agent_types import AssistantMessage
-
         session = self.state_manager.session
         partial_text = session._debug_raw_stream_accum
-        if not partial_text.strip():
+        stripped_partial_text = partial_text.strip()
+        if not stripped_partial_text:
             return
 
         latest_assistant_text = ""
@@ -109,7 +129,7 @@ class AgentStreamMixin:
             if isinstance(message, AssistantMessage):
                 latest_assistant_text = extract_text(message)
                 break
-        if latest_assistant_text.strip() == partial_text.strip():
+        if latest_assistant_text.strip() == stripped_partial_text:
             return
 
         interrupted_message = AssistantMessage(
@@ -178,15 +198,16 @@ class AgentStreamMixin:
             return False
         state.last_assistant_message = event_obj.message
         usage = parse_canonical_usage(event_obj.message.usage)
-        session = self.state_manager.session
-        session.usage.last_call_usage = usage
-        session.usage.session_total_usage.add(usage)
+        session_usage = self.state_manager.session.usage
+        session_total_usage = session_usage.session_total_usage
+        session_usage.last_call_usage = usage
+        session_total_usage.add(usage)
         log_usage_update(
-            logger=get_logger(),
-            request_id=session.runtime.request_id,
+            logger=state.logger,
+            request_id=state.runtime.request_id,
             event_name="message_end",
-            last_call_usage=session.usage.last_call_usage,
-            session_total_usage=session.usage.session_total_usage,
+            last_call_usage=usage,
+            session_total_usage=session_total_usage,
         )
         return False
 
@@ -277,15 +298,16 @@ class AgentStreamMixin:
         state: _TinyAgentStreamState,
         baseline_message_count: int,
     ) -> bool:
-        if is_turn_end_event(event):
-            return await self._handle_stream_turn_end(
+        # Message updates dominate the stream (one per delta); test them first.
+        if isinstance(event, MessageUpdateEvent):
+            return await self._handle_stream_message_update(
                 event,
                 agent=agent,
                 state=state,
                 baseline_message_count=baseline_message_count,
             )
-        if isinstance(event, MessageUpdateEvent):
-            return await self._handle_stream_message_update(
+        if is_turn_end_event(event):
+            return await self._handle_stream_turn_end(
                 event,
                 agent=agent,
                 state=state,
@@ -346,6 +368,7 @@ class AgentStreamMixin:
         runtime = self.state_manager.session.runtime
         state = _TinyAgentStreamState(
             runtime=runtime,
+            logger=logger,
             baseline_message_count=baseline_message_count,
             tool_start_times={},
             active_tool_call_ids=set(),
@@ -383,13 +406,14 @@ class AgentStreamMixin:
             if stream_completed:
                 self._active_stream_state = None
 
-        elapsed_ms = (time.perf_counter() - started_at) * _MS_PER_S
-        if first_event_ms is None:
-            end_message = f"Stream: end events={event_count} first_event=none"
-        else:
-            end_message = f"Stream: end events={event_count} first_event={first_event_ms:.1f}ms"
-        logger.lifecycle(end_message)
-        logger.lifecycle(f"Request complete ({elapsed_ms:.0f}ms)")
+        if logger.debug_mode:
+            elapsed_ms = (time.perf_counter() - started_at) * _MS_PER_S
+            if first_event_ms is None:
+                end_message = f"Stream: end events={event_count} first_event=none"
+            else:
+                end_message = f"Stream: end events={event_count} first_event={first_event_ms:.1f}ms"
+            logger.lifecycle(end_message)
+            logger.lifecycle(f"Request complete ({elapsed_ms:.0f}ms)")
 
         error_text = self._agent_error_text(agent)
         if error_text and not is_context_overflow_error(error_text):
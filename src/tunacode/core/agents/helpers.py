@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 
 from tinyagent.agent_types import (
@@ -12,12 +13,17 @@ from tinyagent.agent_types import (
 
 from tunacode.types import UsageMetrics
 
+from tunacode.core.logging.manager import LogManager
 from tunacode.core.types.state_structures import RuntimeState
 
 CONTEXT_OVERFLOW_PATTERNS: tuple[str, ...] = (
     "context_length_exceeded",
     "maximum context length",
 )
+_CONTEXT_OVERFLOW_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in CONTEXT_OVERFLOW_PATTERNS),
+    re.IGNORECASE,
+)
 CONTEXT_OVERFLOW_RETRY_NOTICE = "Context overflow detected. Compacting and retrying once..."
 CONTEXT_OVERFLOW_FAILURE_NOTICE = (
     "Context is still too large after compaction. Use /compact or /clear and retry."
@@ -27,6 +33,7 @@ CONTEXT_OVERFLOW_FAILURE_NOTICE = (
 @dataclass(slots=True)
 class _TinyAgentStreamState:
     runtime: RuntimeState
+    logger: LogManager
     baseline_message_count: int
     tool_start_times: dict[str, float]
     active_tool_call_ids: set[str]
@@ -43,8 +50,7 @@ def coerce_error_text(value: object) -> str:
 def is_context_overflow_error(error_text: str) -> bool:
     if not error_text:
         return False
-    normalized_error = error_text.lower()
-    return any(pattern in normalized_error for pattern in CONTEXT_OVERFLOW_PATTERNS)
+    return _CONTEXT_OVERFLOW_RE.search(error_text) is not None
 
 
 def parse_canonical_usage(raw_usage: object) -> UsageMetrics:
@@ -61,11 +67,9 @@ def extract_tool_result_text(result: AgentToolResult | None) -> str | None:
     if result is None:
         return None
 
-    parts: list[str] = []
-    for item in result.content:
-        if not isinstance(item, TextContent):
-            continue
-        if isinstance(item.text, str):
-            parts.append(item.text)
-
+    parts = [
+        item.text
+        for item in result.content
+        if isinstance(item, TextContent) and isinstance(item.text, str)
+    ]
     return "".join(parts) if parts else None
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import secrets
 import time
-import uuid
 from typing import cast
 
 from tinyagent.agent import Agent
@@ -44,6 +44,7 @@ from .helpers import (
 )
 
 REQUEST_ID_LENGTH = 8
+REQUEST_ID_BYTES = REQUEST_ID_LENGTH // 2
 MILLISECONDS_PER_SECOND = 1000
 
 
@@ -95,46 +96,56 @@ class RequestOrchestrator(AgentStreamMixin):
         logger = get_logger()
         logger.info("Request started", request_id=self.state_manager.session.runtime.request_id)
 
+        # Pre-stream timings only feed lifecycle logs; skip the clock reads otherwise.
+        debug_mode = logger.debug_mode
+
         session = self.state_manager.session
         conversation = session.conversation
-        pre_stream_started_at = time.perf_counter()
+        pre_stream_started_at = time.perf_counter() if debug_mode else 0.0
 
-        agent_started_at = time.perf_counter()
         agent = ac.get_or_create_agent(self.model, self.state_manager)
-        agent_duration_ms = (time.perf_counter() - agent_started_at) * MILLISECONDS_PER_SECOND
-        logger.lifecycle(f"Init: get_or_create_agent dur={agent_duration_ms:.1f}ms")
+        if debug_mode:
+            agent_duration_ms = (
+                time.perf_counter() - pre_stream_started_at
+            ) * MILLISECONDS_PER_SECOND
+            logger.lifecycle(f"Init: get_or_create_agent dur={agent_duration_ms:.1f}ms")
 
         self.compaction_controller.set_status_callback(self.compaction_status_callback)
 
-        compaction_started_at = time.perf_counter()
+        compaction_started_at = time.perf_counter() if debug_mode else 0.0
         compacted_history = await self._compact_history_for_request(conversation.messages)
-        compaction_duration_ms = (
-            time.perf_counter() - compaction_started_at
-        ) * MILLISECONDS_PER_SECOND
-        logger.lifecycle(
-            "Init: "
-            f"compaction in={len(conversation.messages)} "
-            f"out={len(compacted_history)} "
-            f"dur={compaction_duration_ms:.1f}ms"
-        )
+        if debug_mode:
+            compaction_duration_ms = (
+                time.perf_counter() - compaction_started_at
+            ) * MILLISECONDS_PER_SECOND
+            logger.lifecycle(
+                "Init: "
+                f"compaction in={len(conversation.messages)} "
+                f"out={len(compacted_history)} "
+                f"dur={compaction_duration_ms:.1f}ms"
+            )
 
         baseline_message_count = len(conversation.messages)
-        pre_request_history = list(conversation.messages)
+        # No copy needed: conversation.messages is only ever rebound (never mutated in
+        # place) on the success path, and agent.replace_messages() copies its input.
+        pre_request_history = conversation.messages
 
-        replace_messages_started_at = time.perf_counter()
+        replace_messages_started_at = time.perf_counter() if debug_mode else 0.0
         agent.replace_messages(compacted_history)
-        replace_messages_duration_ms = (
-            time.perf_counter() - replace_messages_started_at
-        ) * MILLISECONDS_PER_SECOND
-        logger.lifecycle(
-            "Init: "
-            f"replace_messages count={len(compacted_history)} "
-            f"dur={replace_messages_duration_ms:.1f}ms"
-        )
-        pre_stream_duration_ms = (
-            time.perf_counter() - pre_stream_started_at
-        ) * MILLISECONDS_PER_SECOND
-        logger.lifecycle(f"Init: pre_stream total={pre_stream_duration_ms:.1f}ms")
+        if debug_mode:
+            replace_messages_ended_at = time.perf_counter()
+            replace_messages_duration_ms = (
+                replace_messages_ended_at - replace_messages_started_at
+            ) * MILLISECONDS_PER_SECOND
+            logger.lifecycle(
+                "Init: "
+                f"replace_messages count={len(compacted_history)} "
+                f"dur={replace_messages_duration_ms:.1f}ms"
+            )
+            pre_stream_duration_ms = (
+                replace_messages_ended_at - pre_stream_started_at
+            ) * MILLISECONDS_PER_SECOND
+            logger.lifecycle(f"Init: pre_stream total={pre_stream_duration_ms:.1f}ms")
         session._debug_raw_stream_accum = ""
 
         await self._run_stream(
@@ -148,7 +159,7 @@ class RequestOrchestrator(AgentStreamMixin):
         return agent
 
     def _initialize_request(self) -> None:
-        request_id = str(uuid.uuid4())[:REQUEST_ID_LENGTH]
+        request_id = secrets.token_hex(REQUEST_ID_BYTES)
         session = self.state_manager.session
         runtime = session.runtime
         runtime.request_id = request_id
@@ -289,18 +289,14 @@ def _serialize_messages(messages: Sequence[ResumeMessage]) -> list[dict[str, obj
     return [_serialize_message(message) for message in messages]
 
 
-def _assistant_tool_call_ids(message: AssistantResumeMessage) -> set[ToolCallId]:
-    return {
-        item.tool_call_id for item in message.content or [] if isinstance(item, ToolCallContentItem)
-    }
-
-
 def _find_dangling_ids(messages: list[ResumeMessage]) -> set[ToolCallId]:
     tool_call_ids: set[ToolCallId] = set()
     tool_return_ids: set[ToolCallId] = set()
     for message in messages:
         if isinstance(message, AssistantResumeMessage):
-            tool_call_ids.update(_assistant_tool_call_ids(message))
+            for item in message.content or ():
+                if isinstance(item, ToolCallContentItem):
+                    tool_call_ids.add(item.tool_call_id)
         elif isinstance(message, ToolResultResumeMessage):
             tool_return_ids.add(message.tool_call_id)
     return tool_call_ids - tool_return_ids
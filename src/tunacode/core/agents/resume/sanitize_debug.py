@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from tunacode.types import ToolCallId
 
 from tunacode.core.agents.resume.sanitize import (
@@ -20,6 +22,15 @@ from tunacode.core.logging import get_logger
 
 DEBUG_PREVIEW_SUFFIX = "..."
 DEBUG_NEWLINE_REPLACEMENT = "\\n"
+DEBUG_CARRIAGE_RETURN_REPLACEMENT = "\\r"
+DEBUG_TAB_REPLACEMENT = "\\t"
+_DEBUG_PREVIEW_TRANSLATION = str.maketrans(
+    {
+        "\n": DEBUG_NEWLINE_REPLACEMENT,
+        "\r": DEBUG_CARRIAGE_RETURN_REPLACEMENT,
+        "\t": DEBUG_TAB_REPLACEMENT,
+    }
+)
 DEBUG_HISTORY_MESSAGE_PREVIEW_LEN = 160
 DEBUG_HISTORY_CONTENT_ITEM_PREVIEW_LEN = 140
 
@@ -27,14 +38,19 @@ DEBUG_HISTORY_CONTENT_ITEM_PREVIEW_LEN = 140
 def _format_debug_preview(value: object, max_len: int) -> tuple[str, int]:
     if value is None:
         return "", 0
-
-    value_text = value if isinstance(value, str) else str(value)
+    if isinstance(value, str):
+        value_text = value
+    elif isinstance(value, (dict, list, tuple)) and not value:
+        # Empty tool-call arguments are common; skip repr() for them.
+        return "", 0
+    else:
+        value_text = str(value)
     value_len = len(value_text)
     preview_len = min(max_len, value_len)
     preview_text = value_text[:preview_len]
     if value_len > preview_len:
         preview_text = f"{preview_text}{DEBUG_PREVIEW_SUFFIX}"
-    return preview_text.replace("\n", DEBUG_NEWLINE_REPLACEMENT), value_len
+    return preview_text.translate(_DEBUG_PREVIEW_TRANSLATION), value_len
 
 
 def _format_content_item(item: object) -> str:
@@ -55,7 +71,10 @@ def _format_content_item(item: object) -> str:
     return f"<{type(item).__name__}>"
 
 
-def _content_items_text(items: list[object]) -> str:
+def _content_items_text(items: Sequence[object] | None) -> str:
+    if not items:
+        return ""
+
     chunks: list[str] = []
     for item in items:
         if isinstance(item, TextContentItem):
@@ -69,11 +88,11 @@ def _content_items_text(items: list[object]) -> str:
 
 def _message_text(message: ResumeMessage) -> str:
     if isinstance(message, AssistantResumeMessage):
-        return _content_items_text(list(message.content or []))
+        return _content_items_text(message.content)
     if isinstance(message, ToolResultResumeMessage):
-        return _content_items_text(list(message.content))
+        return _content_items_text(message.content)
     request_message: UserResumeMessage | SystemResumeMessage = message
-    return _content_items_text(list(request_message.content or []))
+    return _content_items_text(request_message.content)
 
 
 def _tool_call_ids(message: ResumeMessage) -> set[ToolCallId]:
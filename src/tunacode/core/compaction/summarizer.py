@@ -250,7 +250,7 @@ def _has_safe_assistant_turn_shape_without_stop_reason(message: AssistantMessage
         if isinstance(item, ToolCallContent):
             return False
 
-        if not isinstance(item, TextContent):
+        if has_non_empty_text or not isinstance(item, TextContent):
             continue
 
         text = item.text
@@ -13,6 +13,9 @@ COST_PRECISION = 6
 class LifecycleLogger(Protocol):
     """Minimal logger contract required for lifecycle tracing."""
 
+    @property
+    def debug_mode(self) -> bool: ...
+
     def lifecycle(self, message: str) -> None: ...
 
 
@@ -56,6 +59,8 @@ def log_usage_update(
     session_total_usage: UsageMetrics,
 ) -> None:
     """Emit a lifecycle log line for a usage update event."""
+    if not logger.debug_mode:
+        return
     lifecycle_message = build_usage_lifecycle_message(
         request_id=request_id,
         event_name=event_name,
@@ -99,6 +104,8 @@ def log_resource_bar_update(
     session_cost: float,
 ) -> None:
     """Emit a lifecycle log line for resource bar refreshes."""
+    if not logger.debug_mode:
+        return
     lifecycle_message = build_resource_bar_lifecycle_message(
         model=model,
         estimated_tokens=estimated_tokens,
@@ -114,9 +114,12 @@ class FileHandler(Handler):
 
     def _rotate_if_needed(self) -> None:
         """Rotate log file if it exceeds max size."""
-        if not self._log_path.exists():
+        # One stat per record: a missing file and a small file both mean no rotation.
+        try:
+            log_size = self._log_path.stat().st_size
+        except FileNotFoundError:
             return
-        if self._log_path.stat().st_size < self.MAX_SIZE_BYTES:
+        if log_size < self.MAX_SIZE_BYTES:
             return
 
         # Rotate existing backups
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from tunacode.types import ModelPricing
+
+from tunacode.infrastructure.cache import ManualStrategy, get_cache, register_cache
+
+MODEL_PRICING_CACHE_NAME = "tunacode.models.pricing"
+
+_NO_PRICING_SENTINEL = object()
+
+register_cache(MODEL_PRICING_CACHE_NAME, ManualStrategy())
+
+
+def try_get_model_pricing(model_string: str) -> tuple[bool, ModelPricing | None]:
+    """Return (hit, pricing); a hit with None means the model has no pricing data."""
+
+    cached = get_cache(MODEL_PRICING_CACHE_NAME).get(model_string)
+    if cached is None:
+        return False, None
+    if cached is _NO_PRICING_SENTINEL:
+        return True, None
+    if not isinstance(cached, ModelPricing):
+        raise TypeError(
+            f"Model pricing cache value must be ModelPricing or sentinel, "
+            f"got {type(cached).__name__}"
+        )
+    return True, cached
+
+
+def set_model_pricing(model_string: str, pricing: ModelPricing | None) -> None:
+    value = _NO_PRICING_SENTINEL if pricing is None else pricing
+    get_cache(MODEL_PRICING_CACHE_NAME).set(model_string, value)
+
+
+def clear_model_pricing_cache() -> None:
+    get_cache(MODEL_PRICING_CACHE_NAME).clear()
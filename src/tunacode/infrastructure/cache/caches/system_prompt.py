@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tunacode.infrastructure.cache import (
+    MtimeMetadata,
+    MtimeStrategy,
+    get_cache,
+    register_cache,
+    stat_mtime_ns,
+)
+
+SYSTEM_PROMPT_CACHE_NAME = "tunacode.system_prompt"
+
+register_cache(SYSTEM_PROMPT_CACHE_NAME, MtimeStrategy())
+
+
+def get_system_prompt(path: Path) -> str | None:
+    """Return cached system prompt content for the file at path.
+
+    The cache is mtime-aware (nanoseconds), so edits to the prompt file are
+    picked up on the next lookup without an explicit clear.
+    """
+
+    cached = get_cache(SYSTEM_PROMPT_CACHE_NAME).get(path.resolve())
+    if cached is None:
+        return None
+    if not isinstance(cached, str):
+        raise TypeError(f"System prompt cache value must be str, got {type(cached).__name__}")
+    return cached
+
+
+def set_system_prompt(path: Path, content: str) -> None:
+    resolved_path = path.resolve()
+    cache = get_cache(SYSTEM_PROMPT_CACHE_NAME)
+    cache.set(resolved_path, content)
+    cache.set_metadata(
+        resolved_path,
+        MtimeMetadata(path=resolved_path, mtime_ns=stat_mtime_ns(resolved_path)),
+    )
+
+
+def clear_system_prompt_cache() -> None:
+    get_cache(SYSTEM_PROMPT_CACHE_NAME).clear()
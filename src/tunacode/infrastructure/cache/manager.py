@@ -82,6 +82,10 @@ class CacheManager:
 
     @classmethod
     def get_instance(cls) -> CacheManager:
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._instance_lock:
             if cls._instance is None:
                 cls._instance = cls()
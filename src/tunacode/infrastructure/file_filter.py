@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import re
 from collections.abc import Sequence
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from textual.fuzzy import FuzzySearch
 
 from tunacode.configuration.ignore_patterns import (
     GITIGNORE_FILE_NAME,
+    compile_ignore_regex,
     compile_ignore_spec,
     merge_ignore_patterns,
     read_ignore_file_lines,
@@ -33,6 +35,7 @@ class FileFilter:
         self._result_limit = result_limit
         self._max_depth = max_depth
         self._spec = self._build_spec()
+        self._ignore_regex: re.Pattern[str] | None = compile_ignore_regex(self._spec)
 
     def _build_spec(self) -> pathspec.PathSpec:
         gitignore = self.root / GITIGNORE_FILE_NAME
@@ -40,14 +43,42 @@ class FileFilter:
         return compile_ignore_spec(patterns)
 
     def is_ignored(self, path: Path) -> bool:
+        return self._is_ignored(path, is_dir=None)
+
+    def _is_ignored(self, path: Path, *, is_dir: bool | None, rel_posix: str | None = None) -> bool:
+        """Pass is_dir when the entry kind is already known to skip the stat.
+
+        Walk callers also pass rel_posix, joined from their directory's relative
+        path, to skip relative_to() and as_posix() per entry.
+        """
+        if rel_posix is None:
+            try:
+                rel_posix = path.relative_to(self.root).as_posix()
+            except ValueError:
+                return False
+        if self._matches_ignore(rel_posix):
+            return True
+        if is_dir is None:
+            is_dir = path.is_dir()
+        return is_dir and self._matches_ignore(f"{rel_posix}/")
+
+    def _walk_root_posix(self, root_path: Path) -> str | None:
+        """Return a walked directory's root-relative posix path, computed once per directory."""
         try:
-            rel = path.relative_to(self.root)
-            rel_posix = rel.as_posix()
-            if self._spec.match_file(rel_posix):
-                return True
-            return path.is_dir() and self._spec.match_file(f"{rel_posix}/")
+            return root_path.relative_to(self.root).as_posix()
         except ValueError:
-            return False
+            return None
+
+    @staticmethod
+    def _walk_entry_posix(root_posix: str | None, name: str) -> str | None:
+        if root_posix is None:
+            return None
+        return name if root_posix == "." else f"{root_posix}/{name}"
+
+    def _matches_ignore(self, rel_posix: str) -> bool:
+        if self._ignore_regex is None:
+            return self._spec.match_file(rel_posix)
+        return self._ignore_regex.match(rel_posix) is not None
 
     def _parse_prefix(self, prefix: str) -> tuple[Path, str]:
         """Parse prefix into search path and name filter."""
@@ -115,6 +146,7 @@ class FileFilter:
         self,
         files: list[str],
         root_path: Path,
+        root_posix: str | None,
         name_prefix: str,
         search_path: Path,
         current_depth: int,
@@ -124,7 +156,8 @@ class FileFilter:
         """Collect matching files into results. Returns True when limit reached."""
         for f in sorted(files):
             file_path = root_path / f
-            if self.is_ignored(file_path):
+            rel_posix = self._walk_entry_posix(root_posix, f)
+            if self._is_ignored(file_path, is_dir=False, rel_posix=rel_posix):
                 continue
             if not self._matches_prefix(file_path, name_prefix, search_path):
                 continue
@@ -159,7 +192,16 @@ class FileFilter:
             if current_depth >= effective_max_depth:
                 dirs[:] = []
 
-            dirs[:] = sorted(d for d in dirs if not self.is_ignored(root_path / d))
+            root_posix = self._walk_root_posix(root_path)
+            dirs[:] = sorted(
+                d
+                for d in dirs
+                if not self._is_ignored(
+                    root_path / d,
+                    is_dir=True,
+                    rel_posix=self._walk_entry_posix(root_posix, d),
+                )
+            )
 
             dirs_full = self._collect_dirs(
                 dirs,
@@ -176,6 +218,7 @@ class FileFilter:
             files_full = self._collect_files(
                 files,
                 root_path,
+                root_posix,
                 name_prefix,
                 search_path,
                 current_depth,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -111,10 +112,14 @@ def _discover_root_skills(root: SkillRoot) -> dict[str, DiscoveredSkillPath]:
     discovered_by_name: dict[str, DiscoveredSkillPath] = {}
     discovered_by_key: dict[str, str] = {}
 
-    for child in sorted(root_path.iterdir(), key=lambda entry: entry.name.lower()):
-        if not child.is_dir():
-            continue
+    # DirEntry.is_dir reuses the type from the directory listing, avoiding a stat per child.
+    with os.scandir(root_path) as entries:
+        child_dirs = sorted(
+            (Path(entry.path) for entry in entries if entry.is_dir()),
+            key=lambda child: child.name.lower(),
+        )
 
+    for child in child_dirs:
         skill_path = child / SKILL_FILE_NAME
         if not skill_path.is_file():
             continue
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -39,18 +40,20 @@ PATH_SUFFIXES = {
 }
 URL_PREFIXES = ("http://", "https://")
 DISALLOWED_REFERENCE_PREFIXES = ("#", "/", "~")
-EXCLUDED_RELATED_PATH_PARTS = {
-    ".git",
-    ".mypy_cache",
-    ".pytest_cache",
-    ".ruff_cache",
-    ".venv",
-    "__pycache__",
-    "node_modules",
-    "venv",
-}
-EXCLUDED_RELATED_FILE_NAMES = {".DS_Store"}
-EXCLUDED_RELATED_FILE_SUFFIXES = {".pyc"}
+EXCLUDED_RELATED_PATH_PARTS = frozenset(
+    {
+        ".git",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".venv",
+        "__pycache__",
+        "node_modules",
+        "venv",
+    }
+)
+EXCLUDED_RELATED_FILE_NAMES = frozenset({".DS_Store"})
+EXCLUDED_RELATED_FILE_SUFFIXES = frozenset({".pyc"})
 
 
 class SkillLoadError(RuntimeError):
@@ -109,6 +112,7 @@ def load_skill(discovered_skill: DiscoveredSkillPath) -> LoadedSkill:
         skill_dir=discovered_skill.skill_dir,
         skill_path=discovered_skill.skill_path,
         content=parsed_document.content,
+        content_sha256=hashlib.sha256(parsed_document.content.encode("utf-8")).hexdigest(),
         referenced_paths=referenced_paths,
     )
 
@@ -334,7 +338,7 @@ def _should_include_related_path(path: Path, skill_path: Path) -> bool:
     if resolved_path.suffix.lower() in EXCLUDED_RELATED_FILE_SUFFIXES:
         return False
 
-    return not any(part in EXCLUDED_RELATED_PATH_PARTS for part in resolved_path.parts)
+    return EXCLUDED_RELATED_PATH_PARTS.isdisjoint(resolved_path.parts)
 
 
 def _iter_reference_candidates(content: str) -> list[str]:
@@ -33,6 +33,7 @@ class LoadedSkill:
     skill_dir: Path
     skill_path: Path
     content: str
+    content_sha256: str
     referenced_paths: tuple[Path, ...]
 
 
@@ -47,6 +48,7 @@ class SelectedSkill:
     referenced_paths: tuple[Path, ...]
     related_paths: tuple[Path, ...]
     content: str
+    content_sha256: str
     attachment_index: int
 
 
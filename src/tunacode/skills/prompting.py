@@ -35,6 +35,19 @@ SKILL_RELATED_FILES_LABEL = "Other files available in the skill directory"
 SKILL_CONTENT_LABEL = "Full SKILL.md content"
 EMPTY_PATH_LIST_LABEL = "(none)"
 
+SKILL_STATUS_LINE = f"{SKILL_STATUS_LABEL}: ACTIVE - explicitly loaded by the user via /skills"
+SKILL_PATHS_HINT = (
+    "This skill is active right now. Use these absolute paths directly when you need skill files."
+)
+SKILL_REFERENCED_FILES_HEADER = f"{SKILL_REFERENCED_FILES_LABEL}:"
+SKILL_RELATED_FILES_HEADER = f"{SKILL_RELATED_FILES_LABEL}:"
+SKILL_CONTENT_HEADER = f"{SKILL_CONTENT_LABEL}:"
+EMPTY_PATH_LIST_LINE = f"- {EMPTY_PATH_LIST_LABEL}"
+
+# Paths cannot contain NUL, and every labelled part starts with a non-"/" prefix, so
+# absolute path lists stay unambiguous inside one digest.
+_FINGERPRINT_PATH_SEPARATOR = "\0"
+
 
 def render_available_skills_block(skill_summaries: list[SkillSummary]) -> str:
     lines = ["", "", AVAILABLE_SKILLS_SECTION_TITLE]
@@ -61,24 +74,22 @@ def render_selected_skills_block(selected_skills: list[SelectedSkill]) -> str:
 
 def _append_selected_skill_block(lines: list[str], selected_skill: SelectedSkill) -> None:
     lines.append(f"## {selected_skill.name} ({selected_skill.source.value})")
-    lines.append(f"{SKILL_STATUS_LABEL}: ACTIVE - explicitly loaded by the user via /skills")
+    lines.append(SKILL_STATUS_LINE)
     lines.append(f"{SKILL_DIRECTORY_LABEL}: {selected_skill.skill_dir}")
     lines.append(f"{SKILL_FILE_LABEL}: {selected_skill.skill_path}")
-    lines.append(
-        "This skill is active right now. "
-        "Use these absolute paths directly when you need skill files."
-    )
-    lines.append(f"{SKILL_REFERENCED_FILES_LABEL}:")
+    lines.append(SKILL_PATHS_HINT)
+    lines.append(SKILL_REFERENCED_FILES_HEADER)
     _append_path_list(lines, selected_skill.referenced_paths)
 
+    referenced_paths = set(selected_skill.referenced_paths)
     additional_related_paths = [
-        path for path in selected_skill.related_paths if path not in selected_skill.referenced_paths
+        path for path in selected_skill.related_paths if path not in referenced_paths
     ]
-    lines.append(f"{SKILL_RELATED_FILES_LABEL}:")
+    lines.append(SKILL_RELATED_FILES_HEADER)
     _append_path_list(lines, additional_related_paths)
 
     lines.append("")
-    lines.append(f"{SKILL_CONTENT_LABEL}:")
+    lines.append(SKILL_CONTENT_HEADER)
     lines.append(selected_skill.content)
     lines.append("")
 
@@ -86,7 +97,7 @@ def _append_selected_skill_block(lines: list[str], selected_skill: SelectedSkill
 def _append_path_list(lines: list[str], paths: Iterable[Path]) -> None:
     materialized_paths = list(paths)
     if not materialized_paths:
-        lines.append(f"- {EMPTY_PATH_LIST_LABEL}")
+        lines.append(EMPTY_PATH_LIST_LINE)
         return
 
     for path in materialized_paths:
@@ -104,20 +115,21 @@ def compute_skills_prompt_fingerprint(
             f"summary:{skill_summary.name}:{skill_summary.description}:{skill_summary.source.value}"
         )
 
+    # Runs on every request, so path lists feed the single digest instead of nested hashes.
     for selected_skill in selected_skills:
-        content_hash = hashlib.sha256(selected_skill.content.encode("utf-8")).hexdigest()
-        referenced_paths_hash = _hash_paths(selected_skill.referenced_paths)
-        related_paths_hash = _hash_paths(selected_skill.related_paths)
         fingerprint_parts.append(
             "selected:"
             f"{selected_skill.name}:{selected_skill.source.value}:{selected_skill.skill_dir}:"
-            f"{selected_skill.skill_path}:{content_hash}:{referenced_paths_hash}:{related_paths_hash}"
+            f"{selected_skill.skill_path}:{selected_skill.content_sha256}"
+        )
+        fingerprint_parts.append(
+            f"referenced:{_join_fingerprint_paths(selected_skill.referenced_paths)}"
         )
+        fingerprint_parts.append(f"related:{_join_fingerprint_paths(selected_skill.related_paths)}")
 
-    fingerprint_input = "|".join(fingerprint_parts)
+    fingerprint_input = _FINGERPRINT_PATH_SEPARATOR.join(fingerprint_parts)
     return hashlib.sha256(fingerprint_input.encode("utf-8")).hexdigest()
 
 
-def _hash_paths(paths: Iterable[Path]) -> str:
-    joined_paths = "|".join(str(path) for path in paths)
-    return hashlib.sha256(joined_paths.encode("utf-8")).hexdigest()
+def _join_fingerprint_paths(paths: Iterable[Path]) -> str:
+    return _FINGERPRINT_PATH_SEPARATOR.join(str(path) for path in paths)
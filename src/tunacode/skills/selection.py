@@ -66,6 +66,7 @@ def resolve_selected_skills(
                 referenced_paths=loaded_skill.referenced_paths,
                 related_paths=related_paths,
                 content=loaded_skill.content,
+                content_sha256=loaded_skill.content_sha256,
                 attachment_index=attachment_index,
             )
         )
@@ -4,14 +4,16 @@ Provides a read-side annotation + write-side validation pattern:
 - On read: each line is tagged with a short content hash (2 hex chars)
 - On edit: the hash is validated against cached state to detect stale references
 
-The hash is ``md5(line_content)[:2]``, giving 256 buckets — enough to
-catch stale references without bloating context.
+The hash is the low byte of ``crc32(line_content)`` as two hex chars, giving
+256 buckets — enough to catch stale references without bloating context.
+Hashes are only compared within a session, so the function is free to change.
 """
 
-import hashlib
+import zlib
 from typing import NamedTuple
 
 HASH_LENGTH = 2
+HASH_MASK = 0xFF
 HASH_SEPARATOR = "|"
 LINE_HASH_SEPARATOR = ":"
 
@@ -25,12 +27,13 @@ class HashedLine(NamedTuple):
 
 
 def content_hash(line: str) -> str:
-    """Compute a short MD5 hash of a line's content.
+    """Compute a short CRC32-based hash of a line's content.
 
     Two hex characters provide 256 buckets — sufficient to detect stale
-    references without inflating the context window.
+    references without inflating the context window. CRC32 runs in C without
+    allocating a hash object, which matters since every read line is hashed.
     """
-    return hashlib.md5(line.encode(), usedforsecurity=False).hexdigest()[:HASH_LENGTH]
+    return f"{zlib.crc32(line.encode()) & HASH_MASK:0{HASH_LENGTH}x}"
 
 
 def tag_lines(content: str, offset: int = 0) -> list[HashedLine]:
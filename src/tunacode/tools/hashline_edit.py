@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import difflib
 from collections.abc import Callable
-from pathlib import Path
 
 from tinyagent.agent_types import (
     AgentTool,
@@ -228,11 +227,11 @@ async def _run_hashline_edit(
     after: str | None = None,
     new: str = "",
 ) -> str:
-    path = Path(filepath)
-    if not await asyncio.to_thread(path.exists):
-        raise ToolRetryError(FILE_NOT_FOUND_MESSAGE.format(filepath=filepath))
+    try:
+        original_lines, had_trailing_newline = await asyncio.to_thread(_read_file_lines, filepath)
+    except FileNotFoundError as exc:
+        raise ToolRetryError(FILE_NOT_FOUND_MESSAGE.format(filepath=filepath)) from exc
 
-    original_lines, had_trailing_newline = await asyncio.to_thread(_read_file_lines, filepath)
     if operation == "replace":
         new_lines, description, cache_mutation = _apply_replace(filepath, original_lines, line, new)
     elif operation == "replace_range":
@@ -13,6 +13,7 @@ from tunacode.configuration.ignore_patterns import (
     DEFAULT_EXCLUDE_DIRS,
     DEFAULT_IGNORE_PATTERNS,
     GITIGNORE_FILE_NAME,
+    compile_ignore_regex,
     compile_ignore_spec,
     merge_ignore_patterns,
     read_ignore_file_lines,
@@ -20,6 +21,7 @@ from tunacode.configuration.ignore_patterns import (
 
 PATH_SEPARATOR = "/"
 MISSING_GITIGNORE_MTIME_NS = 0
+MATCH_CACHE_MAX_ENTRIES = 8192
 ROOT_NOT_FOUND_ERROR = "Ignore root not found: {root}."
 ROOT_NOT_DIRECTORY_ERROR = "Ignore root is not a directory: {root}."
 PATH_OUTSIDE_ROOT_ERROR = "Path '{path}' is outside ignore root '{root}'."
@@ -71,12 +73,14 @@ class IgnoreManager:
         self._patterns = patterns_tuple
         self._exclude_dirs = exclude_dirs
         self._spec = compile_ignore_spec(patterns_tuple)
+        self._regex = compile_ignore_regex(self._spec)
+        self._match_cache: dict[str, bool] = {}
 
     def should_ignore(self, path: Path) -> bool:
         relative_path = self._normalize_path(path)
         if self._is_fast_excluded(relative_path):
             return True
-        return self._spec.match_file(relative_path.as_posix())
+        return self._matches(relative_path.as_posix())
 
     def should_ignore_dir(self, path: Path) -> bool:
         relative_path = self._normalize_path(path)
@@ -84,11 +88,11 @@ class IgnoreManager:
             return True
 
         rel_posix = relative_path.as_posix()
-        if self._spec.match_file(rel_posix):
+        if self._matches(rel_posix):
             return True
 
         dir_path = f"{rel_posix}{PATH_SEPARATOR}"
-        return self._spec.match_file(dir_path)
+        return self._matches(dir_path)
 
     def filter_paths(self, paths: Iterable[Path]) -> Iterator[Path]:
         for path in paths:
@@ -116,8 +120,25 @@ class IgnoreManager:
             message = PATH_OUTSIDE_ROOT_ERROR.format(path=candidate_path, root=self._root)
             raise ValueError(message) from exc
 
+    def _matches(self, rel_posix: str) -> bool:
+        cached = self._match_cache.get(rel_posix)
+        if cached is not None:
+            return cached
+
+        if self._regex is None:
+            matched = self._spec.match_file(rel_posix)
+        else:
+            matched = self._regex.match(rel_posix) is not None
+
+        # Patterns are fixed per instance, so results stay valid; bound memory
+        # by starting over rather than tracking recency.
+        if len(self._match_cache) >= MATCH_CACHE_MAX_ENTRIES:
+            self._match_cache.clear()
+        self._match_cache[rel_posix] = matched
+        return matched
+
     def _is_fast_excluded(self, relative_path: Path) -> bool:
-        return any(part in self._exclude_dirs for part in relative_path.parts)
+        return not self._exclude_dirs.isdisjoint(relative_path.parts)
 
 
 def create_ignore_manager(
@@ -6,23 +6,41 @@ can validate that a file has not changed since the model last read it.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Mapping
 from types import MappingProxyType
 
 from tunacode.tools.hashline import HashedLine, content_hash
 
-# Module-level singleton cache: filepath -> {line_number -> HashedLine}
-_cache: dict[str, dict[int, HashedLine]] = {}
+# read_file caps files at 100KB, so this bounds retained content to a few MB.
+MAX_CACHED_FILES = 128
+
+# Module-level singleton LRU cache: filepath -> {line_number -> HashedLine}
+_cache: OrderedDict[str, dict[int, HashedLine]] = OrderedDict()
 
 
 def store(filepath: str, lines: list[HashedLine]) -> None:
-    """Cache hashed lines for a file, replacing any prior state."""
+    """Cache hashed lines for a file, replacing any prior state.
+
+    The least recently used file is evicted once MAX_CACHED_FILES is exceeded;
+    edits against an evicted file fail validation until it is read again.
+    """
     _cache[filepath] = {hl.line_number: hl for hl in lines}
+    _cache.move_to_end(filepath)
+    while len(_cache) > MAX_CACHED_FILES:
+        _cache.popitem(last=False)
+
+
+def _touch(filepath: str) -> dict[int, HashedLine] | None:
+    file_lines = _cache.get(filepath)
+    if file_lines is not None:
+        _cache.move_to_end(filepath)
+    return file_lines
 
 
 def get(filepath: str) -> Mapping[int, HashedLine] | None:
     """Return cached lines for a file as a read-only view, or None if uncached."""
-    file_lines = _cache.get(filepath)
+    file_lines = _touch(filepath)
     if file_lines is None:
         return None
     return MappingProxyType(file_lines)
@@ -30,7 +48,7 @@ def get(filepath: str) -> Mapping[int, HashedLine] | None:
 
 def get_line(filepath: str, line_number: int) -> HashedLine | None:
     """Return a single cached line, or None if not cached."""
-    file_lines = _cache.get(filepath)
+    file_lines = _touch(filepath)
     if file_lines is None:
         return None
     return file_lines.get(line_number)
@@ -67,12 +67,6 @@ def _truncate_line(line_text: str, line_limit: int) -> str:
 
 
 async def _run_read_file(filepath: str, offset: int = 0, limit: int | None = None) -> str:
-    if os.path.getsize(filepath) > MAX_FILE_SIZE:
-        raise ToolExecutionError(
-            tool_name="read_file",
-            message=ERROR_FILE_TOO_LARGE.format(filepath=filepath) + MSG_FILE_SIZE_LIMIT,
-        )
-
     effective_limit = limit if limit is not None else DEFAULT_READ_LIMIT
 
     def _read_sync(
@@ -81,6 +75,13 @@ async def _run_read_file(filepath: str, offset: int = 0, limit: int | None = Non
         line_offset: int,
         line_count: int,
     ) -> tuple[str, list[HashedLine]]:
+        # The size stat runs on the worker thread with the read, keeping the loop free.
+        if os.path.getsize(path) > MAX_FILE_SIZE:
+            raise ToolExecutionError(
+                tool_name="read_file",
+                message=ERROR_FILE_TOO_LARGE.format(filepath=path) + MSG_FILE_SIZE_LIMIT,
+            )
+
         display_lines: list[str] = []
         hashed_lines: list[HashedLine] = []
         skipped_lines = 0
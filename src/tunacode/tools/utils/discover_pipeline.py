@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -27,6 +28,25 @@ from tunacode.tools.utils.discover_types import (
     Relevance,
 )
 
+_SYMBOL_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"(?:def|class)\s+([a-zA-Z_]\w+)"),
+    re.compile(r"function\s+([a-zA-Z_]\w+)"),
+    re.compile(r"(?:export\s+)?class\s+([a-zA-Z_]\w+)"),
+    re.compile(r"func\s+(?:\([^)]+\)\s+)?([a-zA-Z_]\w+)"),
+    re.compile(r"(?:pub\s+)?(?:fn|struct|enum|trait)\s+([a-zA-Z_]\w+)"),
+)
+
+_DEFINITION_LINE_PATTERN = re.compile(r"\s*(def |class |function |fn |struct |export )")
+
+# Each pattern is paired with a literal it cannot match without, so files lacking
+# the literal skip the regex scan entirely.
+_IMPORT_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("import", re.compile(r"from\s+([\w.]+)\s+import")),
+    ("import", re.compile(r"^import\s+([\w.]+)", re.MULTILINE)),
+    ("from", re.compile(r'from\s+["\']([^"\']+)["\']')),
+    ("require", re.compile(r'require\(["\']([^"\']+)["\']\)')),
+)
+
 
 def _extract_search_terms(query: str) -> dict[str, list[str]]:
     """Extract exact identifiers, filename terms, and content terms from natural language."""
@@ -60,10 +80,16 @@ def _extract_search_terms(query: str) -> dict[str, list[str]]:
     filename_terms = [term for term in filename_terms if term not in NOISE_WORDS]
     content_terms = [term for term in content_terms if term not in NOISE_WORDS]
 
+    unique_exact = list(dict.fromkeys(exact))
+    unique_content = list(dict.fromkeys(content_terms))
+
+    # Content terms derive from the lowercased query and lowercase expansions, so only
+    # exact identifiers need folding; do it once here instead of per scanned line.
     return {
-        "exact": list(dict.fromkeys(exact)),
+        "exact": unique_exact,
         "filename": list(dict.fromkeys(filename_terms)),
-        "content": list(dict.fromkeys(content_terms)),
+        "content": unique_content,
+        "excerpt": [term.lower() for term in unique_exact] + unique_content,
     }
 
 
@@ -84,8 +110,9 @@ def _detect_dominant_extensions(
         if walked >= walk_limit or source_count >= sample_limit:
             break
 
-        if path.is_file() and path.suffix in SOURCE_EXTENSIONS:
-            ext_counts[path.suffix] = ext_counts.get(path.suffix, 0) + 1
+        suffix = path.suffix
+        if suffix in SOURCE_EXTENSIONS and path.is_file():
+            ext_counts[suffix] = ext_counts.get(suffix, 0) + 1
             source_count += 1
 
     sorted_exts = sorted(ext_counts.items(), key=lambda item: -item[1])
@@ -121,6 +148,26 @@ def _extract_terms_from_patterns(patterns: list[str]) -> set[str]:
     return terms
 
 
+def _compile_term_matcher(terms: set[str]) -> re.Pattern[str]:
+    """Fold all pattern terms into one alternation so each path is scanned once."""
+    return re.compile("|".join(re.escape(term) for term in sorted(terms)))
+
+
+def _iter_source_files(root: Path, ignore_manager: IgnoreManager) -> Iterator[Path]:
+    """Yield source files under root, pruning ignored directories before descending."""
+    for dir_path, dir_names, file_names in os.walk(root):
+        current = Path(dir_path)
+        dir_names[:] = [
+            name for name in dir_names if not ignore_manager.should_ignore_dir(current / name)
+        ]
+        for file_name in file_names:
+            if os.path.splitext(file_name)[1] not in SOURCE_EXTENSIONS:
+                continue
+            path = current / file_name
+            if path.is_file():
+                yield path
+
+
 def _collect_candidates(
     patterns: list[str],
     root: Path,
@@ -129,17 +176,17 @@ def _collect_candidates(
 ) -> list[Path]:
     """Walk the tree once, test each source file against all pattern terms."""
     terms = _extract_terms_from_patterns(patterns)
-    candidates: dict[str, Path] = {}
+    if not terms:
+        return []
 
-    for path in root.rglob("*"):
-        if not path.is_file() or path.suffix not in SOURCE_EXTENSIONS:
-            continue
+    term_matcher = _compile_term_matcher(terms)
+    candidates: dict[str, Path] = {}
 
+    for path in _iter_source_files(root, ignore_manager):
         if ignore_manager.should_ignore(path):
             continue
 
-        path_lower = str(path).lower()
-        if not any(term in path_lower for term in terms):
+        if term_matcher.search(str(path).lower()) is None:
             continue
 
         key = str(path.resolve())
@@ -153,7 +200,7 @@ def _collect_candidates(
     return result[:max_candidates]
 
 
-@dataclass
+@dataclass(slots=True)
 class _Prospect:
     path: Path
     keep: bool
@@ -177,13 +224,13 @@ def _evaluate_prospect(
     except (OSError, UnicodeDecodeError):
         return _empty_prospect(path)
 
-    all_lines = text.splitlines()
-    line_count = len(all_lines)
-    preview = "\n".join(all_lines[:max_preview_lines])
+    line_count = _count_lines(text)
+    preview_lines = _head_lines(text, max_preview_lines)
+    preview = "\n".join(preview_lines)
     preview_lower = preview.lower()
 
     exact_hits = sum(1 for term in terms["exact"] if term in preview)
-    content_hits = sum(1 for term in terms["content"] if term.lower() in preview_lower)
+    content_hits = sum(1 for term in terms["content"] if term in preview_lower)
     path_lower = str(path).lower()
     filename_hits = sum(1 for term in terms["filename"] if term in path_lower)
 
@@ -199,21 +246,39 @@ def _evaluate_prospect(
     symbols = _extract_symbols(preview)
     imports = _extract_imports(preview)
     role = _infer_role(path, symbols)
-    excerpt = _build_excerpt(all_lines[:max_preview_lines], terms, max_lines=MAX_EXCERPT_LINES)
+    excerpt = _build_excerpt(preview_lines, terms, max_lines=MAX_EXCERPT_LINES)
 
     return _Prospect(
         path=path,
         keep=True,
         relevance=relevance,
         role=role,
-        key_symbols=symbols[:MAX_SYMBOLS_PER_FILE],
-        imports=imports[:MAX_IMPORTS_PER_FILE],
+        key_symbols=symbols,
+        imports=imports,
         excerpt=excerpt,
         line_count=line_count,
         score=score,
     )
 
 
+def _count_lines(text: str) -> int:
+    """Count lines without materializing them; read_text already normalized newlines."""
+    if not text:
+        return 0
+    newline_count = text.count("\n")
+    return newline_count if text.endswith("\n") else newline_count + 1
+
+
+def _head_lines(text: str, max_lines: int) -> list[str]:
+    """Split only the leading slice of text that can contain the first max_lines lines."""
+    end = -1
+    for _ in range(max_lines):
+        end = text.find("\n", end + 1)
+        if end == -1:
+            return text.splitlines()[:max_lines]
+    return text[: end + 1].splitlines()[:max_lines]
+
+
 def _empty_prospect(path: Path) -> _Prospect:
     return _Prospect(
         path=path,
@@ -227,37 +292,35 @@ def _empty_prospect(path: Path) -> _Prospect:
     )
 
 
-def _extract_symbols(text: str) -> list[str]:
+def _extract_symbols(text: str, limit: int = MAX_SYMBOLS_PER_FILE) -> list[str]:
     """Extract function/class/struct names, filtering out language keywords."""
-    symbols: list[str] = []
-
-    symbols.extend(re.findall(r"(?:def|class)\s+([a-zA-Z_]\w+)", text))
-    symbols.extend(re.findall(r"function\s+([a-zA-Z_]\w+)", text))
-    symbols.extend(re.findall(r"(?:export\s+)?class\s+([a-zA-Z_]\w+)", text))
+    symbols: dict[str, None] = {}
 
-    for match in re.finditer(r"func\s+(?:\([^)]+\)\s+)?([a-zA-Z_]\w+)", text):
-        symbols.append(match.group(1))
+    for pattern in _SYMBOL_PATTERNS:
+        for match in pattern.finditer(text):
+            symbol = match.group(1)
+            if symbol in symbols or symbol in ALL_KEYWORDS:
+                continue
+            symbols[symbol] = None
+            if len(symbols) >= limit:
+                return list(symbols)
 
-    symbols.extend(re.findall(r"(?:pub\s+)?(?:fn|struct|enum|trait)\s+([a-zA-Z_]\w+)", text))
+    return list(symbols)
 
-    seen: set[str] = set()
-    filtered: list[str] = []
-    for symbol in symbols:
-        if symbol not in seen and symbol not in ALL_KEYWORDS:
-            seen.add(symbol)
-            filtered.append(symbol)
 
-    return filtered
+def _extract_imports(text: str, limit: int = MAX_IMPORTS_PER_FILE) -> list[str]:
+    """Extract import paths from source code."""
+    imports: dict[str, None] = {}
 
+    for literal, pattern in _IMPORT_PATTERNS:
+        if literal not in text:
+            continue
+        for match in pattern.finditer(text):
+            imports[match.group(1)] = None
+            if len(imports) >= limit:
+                return list(imports)
 
-def _extract_imports(text: str) -> list[str]:
-    """Extract import paths from source code."""
-    imports: list[str] = []
-    imports.extend(re.findall(r"from\s+([\w.]+)\s+import", text))
-    imports.extend(re.findall(r"^import\s+([\w.]+)", text, re.MULTILINE))
-    imports.extend(re.findall(r'from\s+["\']([^"\']+)["\']', text))
-    imports.extend(re.findall(r'require\(["\']([^"\']+)["\']\)', text))
-    return list(dict.fromkeys(imports))
+    return list(imports)
 
 
 def _infer_role(path: Path, symbols: list[str]) -> str:
@@ -276,18 +339,20 @@ def _build_excerpt(
     max_lines: int = MAX_EXCERPT_LINES,
 ) -> str:
     """Pick the most relevant lines as a compact excerpt."""
-    all_terms = [term.lower() for term in terms["exact"] + terms["content"]]
+    all_terms = terms["excerpt"]
     scored: list[tuple[float, int, str]] = []
 
     for index, line in enumerate(lines):
+        if len(line) < 5:
+            continue
         stripped = line.strip()
-        if not stripped or len(stripped) < 5:
+        if len(stripped) < 5:
             continue
 
         line_lower = stripped.lower()
         score = float(sum(1 for term in all_terms if term in line_lower))
 
-        if re.match(r"\s*(def |class |function |fn |struct |export )", line):
+        if _DEFINITION_LINE_PATTERN.match(line):
             score += 0.5
 
         if score > 0:
@@ -300,18 +365,17 @@ def _build_excerpt(
 
 
 def _cluster_prospects(
-    prospects: list[_Prospect],
+    kept: list[_Prospect],
 ) -> tuple[list[ConceptCluster], list[str]]:
     """Group kept prospects by directory.
 
     Returns (clusters, overflow_dirs) where overflow_dirs lists directories
     whose files were trimmed to stay within MAX_REPORT_FILES.
     """
-    kept = [prospect for prospect in prospects if prospect.keep]
-    kept.sort(key=lambda prospect: -prospect.score)
+    ranked = sorted(kept, key=lambda prospect: -prospect.score)
 
     dir_groups: dict[str, list[_Prospect]] = {}
-    for prospect in kept:
+    for prospect in ranked:
         key = str(prospect.path.parent)
         dir_groups.setdefault(key, []).append(prospect)
 
@@ -373,9 +437,8 @@ def _cluster_prospects(
     return trimmed_clusters, overflow_dirs
 
 
-def _build_relevant_tree(prospects: list[_Prospect], root: Path) -> str:
+def _build_relevant_tree(kept: list[_Prospect], root: Path) -> str:
     """Build a file tree showing only kept prospects."""
-    kept = [prospect for prospect in prospects if prospect.keep]
     if not kept:
         return ""
 
@@ -401,8 +464,9 @@ def _build_relevant_tree(prospects: list[_Prospect], root: Path) -> str:
         depth = path_str.count(os.sep)
         name = Path(path_str).name
         prefix = "  " * depth
-        if path_str in file_relevance:
-            marker = "★" if file_relevance[path_str] == Relevance.HIGH else "◆"
+        relevance = file_relevance.get(path_str)
+        if relevance is not None:
+            marker = "★" if relevance == Relevance.HIGH else "◆"
             lines.append(f"{prefix}{marker} {name}")
         else:
             lines.append(f"{prefix}{name}/")
@@ -416,15 +480,17 @@ def _discover_sync(query: str, project_root: str) -> DiscoveryReport:
     ignore_manager = get_ignore_manager(root)
 
     terms = _extract_search_terms(query)
-    extensions = _detect_dominant_extensions(root)
+    # Extensions only feed per-term glob patterns; skip the sampling walk without terms.
+    extensions = _detect_dominant_extensions(root) if terms["filename"] else []
     patterns = _generate_glob_patterns(terms, extensions)
     candidates = _collect_candidates(patterns, root, ignore_manager)
 
-    prospects = [_evaluate_prospect(path, terms) for path in candidates]
+    # Filter while evaluating so skipped files never land in an intermediate list.
+    prospects = (_evaluate_prospect(path, terms) for path in candidates)
     kept = [prospect for prospect in prospects if prospect.keep]
 
-    clusters, overflow_dirs = _cluster_prospects(prospects)
-    tree = _build_relevant_tree(prospects, root)
+    clusters, overflow_dirs = _cluster_prospects(kept)
+    tree = _build_relevant_tree(kept, root)
 
     high = sum(1 for prospect in kept if prospect.relevance == Relevance.HIGH)
     medium = sum(1 for prospect in kept if prospect.relevance == Relevance.MEDIUM)
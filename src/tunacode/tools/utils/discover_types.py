@@ -18,7 +18,7 @@ class Relevance(Enum):
     MEDIUM = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileEntry:
     """A single discovered file with its role in the codebase."""
 
@@ -31,7 +31,7 @@ class FileEntry:
     excerpt: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ConceptCluster:
     """Group of files that together implement a concept."""
 
@@ -237,7 +237,7 @@ class RipgrepExecutor:
             returncode, stdout_text = await self._run_ripgrep_command(cmd, timeout)
 
             if returncode in RIPGREP_SUCCESS_EXIT_CODES:
-                return [line.strip() for line in stdout_text.splitlines() if line.strip()]
+                return [stripped for line in stdout_text.splitlines() if (stripped := line.strip())]
             return []
 
         except TimeoutError:
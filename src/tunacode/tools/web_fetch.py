@@ -67,9 +67,8 @@ def _text_result(text: str) -> AgentToolResult:
 
 
 def _is_private_ip(ip_str: str) -> bool:
-    for pattern in PRIVATE_IP_PATTERNS:
-        if pattern.match(ip_str):
-            return True
+    if any(pattern.match(ip_str) for pattern in PRIVATE_IP_PATTERNS):
+        return True
 
     try:
         ip = ipaddress.ip_address(ip_str)
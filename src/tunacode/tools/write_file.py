@@ -37,24 +37,31 @@ def _text_result(text: str) -> AgentToolResult:
     return AgentToolResult(content=[TextContent(text=text)], details={})
 
 
-async def _run_write_file(filepath: str, content: str) -> str:
-    if os.path.exists(filepath):
-        raise ToolRetryError(
-            f"File '{filepath}' already exists. "
-            "Read the file first with `read_file`, then use `hashline_edit` to modify it."
-        )
-
+def _write_new_file(filepath: str, content: str) -> str:
     dirpath = os.path.dirname(filepath)
     if dirpath and not os.path.exists(dirpath):
         os.makedirs(dirpath, exist_ok=True)
 
-    with open(filepath, "w", encoding="utf-8") as file_obj:
-        file_obj.write(content)
+    # Exclusive create: the existence check and the open are one atomic step, so
+    # parallel writes to the same path cannot overwrite each other.
+    try:
+        with open(filepath, "x", encoding="utf-8") as file_obj:
+            file_obj.write(content)
+    except FileExistsError as exc:
+        raise ToolRetryError(
+            f"File '{filepath}' already exists. "
+            "Read the file first with `read_file`, then use `hashline_edit` to modify it."
+        ) from exc
 
     result = f"Successfully wrote to new file: {filepath}"
     return result
 
 
+async def _run_write_file(filepath: str, content: str) -> str:
+    # Blocking filesystem work runs off the event loop so parallel tool calls overlap.
+    return await asyncio.to_thread(_write_new_file, filepath, content)
+
+
 async def _execute_write_file(
     tool_call_id: str,
     args: JsonObject,
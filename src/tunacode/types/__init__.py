@@ -80,6 +80,11 @@ from tunacode.types.models_registry import (  # noqa: F401
     RegistryProviderOverride,
 )
 
+_USAGE_COST_REQUIRED_KEYS = frozenset({"input", "output", "cache_read", "cache_write", "total"})
+_USAGE_REQUIRED_KEYS = frozenset(
+    {"input", "output", "cache_read", "cache_write", "total_tokens", "cost"}
+)
+
 
 @dataclass(slots=True)
 class UsageCost:
@@ -105,9 +110,8 @@ class UsageCost:
         if not isinstance(data, dict):
             raise ValueError("usage.cost must be a dict")
 
-        required_keys = frozenset({"input", "output", "cache_read", "cache_write", "total"})
-        missing_keys = sorted(required_keys.difference(data.keys()))
-        if missing_keys:
+        if not data.keys() >= _USAGE_COST_REQUIRED_KEYS:
+            missing_keys = sorted(_USAGE_COST_REQUIRED_KEYS.difference(data.keys()))
             raise ValueError(f"usage.cost missing key(s): {', '.join(missing_keys)}")
 
         return cls(
@@ -155,11 +159,8 @@ class UsageMetrics:
         if not isinstance(data, dict):
             raise ValueError("usage must be a dict")
 
-        required_keys = frozenset(
-            {"input", "output", "cache_read", "cache_write", "total_tokens", "cost"}
-        )
-        missing_keys = sorted(required_keys.difference(data.keys()))
-        if missing_keys:
+        if not data.keys() >= _USAGE_REQUIRED_KEYS:
+            missing_keys = sorted(_USAGE_REQUIRED_KEYS.difference(data.keys()))
             raise ValueError(f"usage missing key(s): {', '.join(missing_keys)}")
 
         cost_raw = data["cost"]
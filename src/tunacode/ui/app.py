@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING, Never
 
 from rich.console import RenderableType
 from rich.text import Text
-from tinyagent.agent_types import AgentMessage
+from tinyagent.agent_types import AgentMessage, AssistantMessage, TextContent, UserMessage
 from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -304,6 +304,10 @@ class TextualReplApp(App[None]):
                 time.monotonic() - thinking_started_at
             ) * self.MILLISECONDS_PER_SECOND
 
+        # Only the request tracer consumes these timings.
+        if not self._request_debug.is_tracing_request:
+            return
+
         flush_duration_ms = (time.monotonic() - flush_started_at) * self.MILLISECONDS_PER_SECOND
         self._request_debug.note_delta_flush(
             stream_batch=stream_batch,
@@ -454,24 +458,16 @@ class TextualReplApp(App[None]):
             self._request_debug.request_finished(total_request_ms=total_request_ms)
 
     def _get_latest_response_text(self) -> str | None:
-        from tinyagent.agent_types import AssistantMessage, TextContent
-
         messages = self.state_manager.session.conversation.messages
         for message in reversed(messages):
             if not isinstance(message, AssistantMessage):
                 continue
 
-            text_segments: list[str] = []
-            for item in message.content:
-                if not isinstance(item, TextContent):
-                    continue
-
-                text_value = item.text
-                if not isinstance(text_value, str) or not text_value:
-                    continue
-
-                text_segments.append(text_value)
-
+            text_segments = [
+                item.text
+                for item in message.content
+                if isinstance(item, TextContent) and isinstance(item.text, str) and item.text
+            ]
             normalized_content = " ".join(text_segments).strip()
             if not normalized_content:
                 return None
@@ -559,32 +555,33 @@ class TextualReplApp(App[None]):
     def _replay_session_messages(self) -> None:
         """Render loaded session messages to ChatContainer."""
         from rich.markdown import Markdown
-        from tinyagent.agent_types import AssistantMessage, UserMessage
 
         from tunacode.utils.messaging import get_content
 
         conversation = self.state_manager.session.conversation
-        for message in conversation.messages:
-            if isinstance(message, UserMessage):
-                content = get_content(message)
-                if not content:
+        # One repaint for the whole restored history instead of one per mounted message.
+        with self.batch_update():
+            for message in conversation.messages:
+                if isinstance(message, UserMessage):
+                    content = get_content(message)
+                    if not content:
+                        continue
+
+                    user_block = Text()
+                    user_block.append(f"| {content}\n", style=STYLE_PRIMARY)
+                    user_block.append("| (restored)", style=f"dim {STYLE_PRIMARY}")
+                    self.chat_container.write(user_block)
                     continue
 
-                user_block = Text()
-                user_block.append(f"| {content}\n", style=STYLE_PRIMARY)
-                user_block.append("| (restored)", style=f"dim {STYLE_PRIMARY}")
-                self.chat_container.write(user_block)
-                continue
-
-            if not isinstance(message, AssistantMessage):
-                continue
+                if not isinstance(message, AssistantMessage):
+                    continue
 
-            content = get_content(message)
-            if not content:
-                continue
+                content = get_content(message)
+                if not content:
+                    continue
 
-            self.chat_container.write(Text("agent:", style="accent"))
-            self.chat_container.write(Markdown(content))
+                self.chat_container.write(Text("agent:", style="accent"))
+                self.chat_container.write(Markdown(content))
 
     def _context_panel_supported_for_width(self, width: int) -> bool:
         return width >= self.CONTEXT_PANEL_MIN_TERMINAL_WIDTH
@@ -12,11 +12,16 @@ from textual.app import App
 from tunacode.core.logging import get_logger
 
 _PREVIEW_MAX_LENGTH = 40
+_PREVIEW_NEWLINE_TABLE = str.maketrans("\n", "⏎")
 _logger = get_logger()
 
 
 def _callable_name(callback: Callable[..., object]) -> str:
-    return getattr(callback, "__name__", repr(callback))
+    # Plain functions always have __name__; only build the repr() fallback when missing.
+    try:
+        return callback.__name__
+    except AttributeError:
+        return repr(callback)
 
 
 def _copy_osc52(text: str) -> None:
@@ -135,21 +140,37 @@ def _copy_to_clipboard(text: str) -> None:
 
 
 def _shorten_preview(texts: list[str]) -> str:
-    dense_text = "⏎".join(texts).replace("\n", "⏎")
+    # Folding newlines is 1:1 per character, so only the visible prefix needs joining
+    # and translating; a large selection is never copied in full.
+    prefix_texts: list[str] = []
+    joined_length = -1
+    for text in texts:
+        prefix_texts.append(text)
+        joined_length += len(text) + 1
+        if joined_length > _PREVIEW_MAX_LENGTH:
+            break
+
+    dense_text = "\n".join(prefix_texts)
     if len(dense_text) > _PREVIEW_MAX_LENGTH:
-        return f"{dense_text[: _PREVIEW_MAX_LENGTH - 1]}…"
-    return dense_text
+        dense_text = f"{dense_text[: _PREVIEW_MAX_LENGTH - 1]}…"
+    return dense_text.translate(_PREVIEW_NEWLINE_TABLE)
 
 
 def _get_selected_texts(app: App) -> list[str]:
-    selected_texts = []
-
-    for widget in app.query("*"):
-        if not hasattr(widget, "text_selection") or not widget.text_selection:
+    selected_texts: list[str] = []
+
+    # Walk the active screen so selections on pushed screens are copied too;
+    # app.query() would walk the default screen instead.
+    screen = app.screen
+    selections = screen.selections
+    if not selections:
+        return selected_texts
+
+    for widget in screen.query("*"):
+        selection = selections.get(widget)
+        if not selection:
             continue
 
-        selection = widget.text_selection
-
         try:
             result = widget.get_selection(selection)
         except Exception as exc:  # nosec B112 - selection copy should remain best-effort
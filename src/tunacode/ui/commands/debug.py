@@ -36,18 +36,12 @@ class DebugCommand(Command):
             log_path_display = str(log_path)
             debug_message = f"Debug logging enabled. Log file: {log_path_display}"
             app.chat_container.write(
-                f"[dim]Debug logging enabled. Logs also written to {log_path_display}[/dim]"
-            )
-            app.chat_container.write(
-                "[dim]Parallel tool-call traces appear as lifecycle lines "
-                "prefixed with 'Parallel tool calls'.[/dim]"
-            )
-            app.chat_container.write(
-                "[dim]Input/request latency traces use lifecycle prefixes "
-                "'Input:', 'Queue:', 'Bridge:', 'UI:', and 'Init:'.[/dim]"
-            )
-            app.chat_container.write(
-                "[dim]Tail latency now breaks out final_flush, response_panel, "
+                f"[dim]Debug logging enabled. Logs also written to {log_path_display}\n"
+                "Parallel tool-call traces appear as lifecycle lines "
+                "prefixed with 'Parallel tool calls'.\n"
+                "Input/request latency traces use lifecycle prefixes "
+                "'Input:', 'Queue:', 'Bridge:', 'UI:', and 'Init:'.\n"
+                "Tail latency now breaks out final_flush, response_panel, "
                 "resource_bar, and save_session timings.[/dim]"
             )
             logger.info(debug_message)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from datetime import datetime
 from enum import StrEnum
@@ -10,6 +11,7 @@ from typing import Any
 from rich.console import Group, RenderableType
 from rich.table import Table
 from rich.text import Text
+from tinyagent.agent_types import TextContent
 
 from tunacode.constants import (
     MAX_PANEL_LINES,
@@ -80,8 +82,13 @@ STATUS_TO_TOOL_PANEL_CLASS: dict[str, str] = {
     "running": "running",
 }
 
+# Tool names and statuses come from a small fixed vocabulary, so memoize normalization.
+CSS_TOKEN_CACHE_MAX_ENTRIES = 256
+_css_token_cache: dict[str, str] = {}
+_CSS_TOKEN_SEPARATOR_PATTERN = re.compile(r"[\W_]+")
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolDisplayData:
     tool_name: str
     status: str
@@ -92,7 +99,7 @@ class ToolDisplayData:
     timestamp: datetime | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorDisplayData:
     error_type: str
     message: str
@@ -102,7 +109,7 @@ class ErrorDisplayData:
     severity: str = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResultData:
     query: str
     results: list[dict[str, Any]]
@@ -372,14 +379,11 @@ def _extract_tool_result_text(result: ToolResult | None) -> str | None:
     if result is None:
         return None
 
-    parts: list[str] = []
-    for item in result.content:
-        if getattr(item, "type", None) != "text":
-            continue
-        text_value = getattr(item, "text", None)
-        if isinstance(text_value, str):
-            parts.append(text_value)
-
+    parts = [
+        item.text
+        for item in result.content
+        if isinstance(item, TextContent) and isinstance(item.text, str)
+    ]
     return "".join(parts) if parts else None
 
 
@@ -415,10 +419,17 @@ def _truncate_search_results(
 
 
 def _normalize_css_token(value: str) -> str:
+    cached = _css_token_cache.get(value)
+    if cached is not None:
+        return cached
+
+    # Collapse every run of non-alphanumeric characters into one hyphen in a single C scan.
     lowered = value.strip().lower()
-    normalized_chars = [character if character.isalnum() else "-" for character in lowered]
-    normalized = "".join(normalized_chars)
-    return "-".join(segment for segment in normalized.split("-") if segment)
+    token = _CSS_TOKEN_SEPARATOR_PATTERN.sub("-", lowered).strip("-")
+    if len(_css_token_cache) >= CSS_TOKEN_CACHE_MAX_ENTRIES:
+        _css_token_cache.clear()
+    _css_token_cache[value] = token
+    return token
 
 
 def _tool_identity_css_classes(tool_name: str) -> str:
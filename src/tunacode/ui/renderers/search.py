@@ -23,7 +23,7 @@ def _paginate(items: list[T], page: int, page_size: int) -> tuple[list[T], int,
     return items[start_idx:end_idx], start_idx, total_pages
 
 
-@dataclass
+@dataclass(slots=True)
 class FileSearchResult:
     file_path: str
     line_number: int | None = None
@@ -33,7 +33,7 @@ class FileSearchResult:
     relevance: float | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CodeSearchResult:
     file_path: str
     symbol_name: str
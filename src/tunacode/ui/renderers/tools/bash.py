@@ -25,6 +25,14 @@ from tunacode.ui.renderers.tools.base import (
 )
 from tunacode.ui.renderers.tools.syntax_utils import detect_code_lexer, syntax_or_text
 
+_COMMAND_PATTERN = re.compile(r"Command: (.+)")
+_EXIT_CODE_PATTERN = re.compile(r"Exit Code: (\d+)")
+_WORKING_DIR_PATTERN = re.compile(r"Working Directory: (.+)")
+_STDOUT_PATTERN = re.compile(r"STDOUT:\n(.*?)(?=\n\nSTDERR:|\Z)", re.DOTALL)
+_STDERR_PATTERN = re.compile(r"STDERR:\n(.*?)(?:\Z)", re.DOTALL)
+_JSON_COMMAND_HINTS = ("--json", "-j ", "| jq", "curl ", "http")
+_JSON_COMMAND_HINT_PATTERN = re.compile("|".join(map(re.escape, _JSON_COMMAND_HINTS)))
+
 
 @dataclass
 class BashData:
@@ -59,9 +67,9 @@ class BashRenderer(BaseToolRenderer[BashData]):
         if not result:
             return None
 
-        command_match = re.search(r"Command: (.+)", result)
-        exit_match = re.search(r"Exit Code: (\d+)", result)
-        cwd_match = re.search(r"Working Directory: (.+)", result)
+        command_match = _COMMAND_PATTERN.search(result)
+        exit_match = _EXIT_CODE_PATTERN.search(result)
+        cwd_match = _WORKING_DIR_PATTERN.search(result)
 
         if not command_match or not exit_match:
             return None
@@ -73,13 +81,13 @@ class BashRenderer(BaseToolRenderer[BashData]):
         stdout = ""
         stderr = ""
 
-        stdout_match = re.search(r"STDOUT:\n(.*?)(?=\n\nSTDERR:|\Z)", result, re.DOTALL)
+        stdout_match = _STDOUT_PATTERN.search(result)
         if stdout_match:
             stdout = stdout_match.group(1).strip()
             if stdout == "(no output)":
                 stdout = ""
 
-        stderr_match = re.search(r"STDERR:\n(.*?)(?:\Z)", result, re.DOTALL)
+        stderr_match = _STDERR_PATTERN.search(result)
         if stderr_match:
             stderr = stderr_match.group(1).strip()
             if stderr == "(no errors)":
@@ -136,7 +144,7 @@ class BashRenderer(BaseToolRenderer[BashData]):
         cmd_lower = command.lower()
 
         # JSON output commands
-        is_json_cmd = any(x in cmd_lower for x in ["--json", "-j ", "| jq", "curl ", "http"])
+        is_json_cmd = _JSON_COMMAND_HINT_PATTERN.search(cmd_lower) is not None
         if is_json_cmd and output.strip().startswith(("{", "[")):
             return "json"
 
@@ -23,13 +23,20 @@ from tunacode.ui.renderers.tools.base import (
     tool_renderer,
 )
 
+_FILE_ENTRY_PATTERN = re.compile(r"([★◆])\s+`(.+?)`\s+—\s+(.+?)\s+\((\d+)L\)")
+_SCANNED_PATTERN = re.compile(r"\((\d+) scanned → (\d+) relevant\)")
+_OVERFLOW_PATTERN = re.compile(r"\(\+(\d+) more in: (.+)\)")
+_TREE_FENCE_OPEN = "```\n"
+_TREE_FENCE_CLOSE = "```"
+_CLUSTER_SECTION_SEPARATOR = "\n## "
+
 
 class Relevance(Enum):
     HIGH = "high"
     MEDIUM = "medium"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoverFile:
     """A single discovered file entry."""
 
@@ -42,7 +49,7 @@ class DiscoverFile:
     excerpt: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoverCluster:
     """A group of files implementing a concept."""
 
@@ -97,12 +104,10 @@ class DiscoverRenderer(BaseToolRenderer[DiscoverData]):
         current_line_count = 0
         current_excerpt = ""
 
-        file_pattern = re.compile(r"([★◆])\s+`(.+?)`\s+—\s+(.+?)\s+\((\d+)L\)")
-
         for raw_line in lines:
             line = raw_line.strip()
 
-            match = file_pattern.match(line)
+            match = _FILE_ENTRY_PATTERN.match(line)
             if match:
                 if current_path:
                     files.append(
@@ -157,7 +162,7 @@ class DiscoverRenderer(BaseToolRenderer[DiscoverData]):
         non_content_prefixes = ("(", "```", "##")
         for line in lines[1:]:
             stripped = line.strip()
-            if stripped and not any(stripped.startswith(p) for p in non_content_prefixes):
+            if stripped and not stripped.startswith(non_content_prefixes):
                 return stripped
         return ""
 
@@ -174,26 +179,29 @@ class DiscoverRenderer(BaseToolRenderer[DiscoverData]):
         if lines[0].startswith("# Discovery:"):
             query = lines[0][len("# Discovery:") :].strip()
 
-        scanned_match = re.search(r"\((\d+) scanned → (\d+) relevant\)", result)
+        scanned_match = _SCANNED_PATTERN.search(result)
         total_scanned = int(scanned_match.group(1)) if scanned_match else 0
         total_candidates = int(scanned_match.group(2)) if scanned_match else 0
 
         summary = self._find_summary(lines)
 
         file_tree = ""
-        tree_match = re.search(r"```\n(.*?)```", result, re.DOTALL)
-        if tree_match:
-            file_tree = tree_match.group(1).strip()
+        tree_start = result.find(_TREE_FENCE_OPEN)
+        if tree_start != -1:
+            tree_body_start = tree_start + len(_TREE_FENCE_OPEN)
+            tree_end = result.find(_TREE_FENCE_CLOSE, tree_body_start)
+            if tree_end != -1:
+                file_tree = result[tree_body_start:tree_end].strip()
 
         clusters: list[DiscoverCluster] = []
-        for section in re.split(r"\n## ", result)[1:]:
+        for section in result.split(_CLUSTER_SECTION_SEPARATOR)[1:]:
             if not section.strip():
                 continue
             cluster = self._parse_cluster_section(section)
             if cluster:
                 clusters.append(cluster)
 
-        overflow_match = re.search(r"\(\+(\d+) more in: (.+)\)", result)
+        overflow_match = _OVERFLOW_PATTERN.search(result)
         overflow_dirs: list[str] = []
         if overflow_match:
             overflow_dirs = [s.strip() for s in overflow_match.group(2).split(",")]
@@ -6,6 +6,7 @@ syntax highlighting across all tool viewports.
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -111,6 +112,22 @@ EXTENSION_LEXERS: dict[str, str] = {
 }
 
 
+LEXER_COLORS: dict[str, str] = {
+    "python": "bright_blue",
+    "javascript": "yellow",
+    "typescript": "yellow",
+    "jsx": "yellow",
+    "tsx": "yellow",
+    "json": "green",
+    "yaml": "green",
+    "toml": "green",
+    "markdown": "cyan",
+    "rst": "cyan",
+    "bash": "magenta",
+    "zsh": "magenta",
+}
+
+
 def get_lexer(filepath: str) -> str:
     """Map file extension to pygments lexer name.
 
@@ -124,8 +141,9 @@ def get_lexer(filepath: str) -> str:
     name = path.name
 
     # Check for exact filename matches first (Dockerfile, Makefile)
-    if name in EXTENSION_LEXERS:
-        return EXTENSION_LEXERS[name]
+    exact_lexer = EXTENSION_LEXERS.get(name)
+    if exact_lexer is not None:
+        return exact_lexer
 
     # Check file extension
     ext = path.suffix.lower()
@@ -141,17 +159,7 @@ def get_color(lexer: str) -> str:
     Returns:
         Color by type, or "" if unknown
     """
-    if lexer == "python":
-        return "bright_blue"
-    if lexer in ("javascript", "typescript", "jsx", "tsx"):
-        return "yellow"
-    if lexer in ("json", "yaml", "toml"):
-        return "green"
-    if lexer in ("markdown", "rst"):
-        return "cyan"
-    if lexer in ("bash", "zsh"):
-        return "magenta"
-    return ""
+    return LEXER_COLORS.get(lexer, "")
 
 
 def syntax_or_text(
@@ -215,6 +223,9 @@ _CONTENT_MARKER_LEXERS: tuple[tuple[tuple[str, ...], str], ...] = (
 )
 
 
+_FIRST_NON_WHITESPACE_PATTERN = re.compile(r"\S")
+
+
 def _detect_shebang(first_line: str) -> str | None:
     """Detect lexer from shebang line."""
     if not first_line.startswith("#!"):
@@ -227,6 +238,10 @@ def _detect_shebang(first_line: str) -> str | None:
 
 def _detect_json(content: str) -> str | None:
     """Detect JSON content."""
+    # Reject non-object output before copying the whole content with strip().
+    first_char = _FIRST_NON_WHITESPACE_PATTERN.search(content)
+    if first_char is None or content[first_char.start()] != "{":
+        return None
     stripped = content.strip()
     if not (stripped.startswith("{") and stripped.endswith("}")):
         return None
@@ -262,5 +277,5 @@ def detect_code_lexer(content: str) -> str | None:
     if not content:
         return None
 
-    first_line = content.split("\n")[0]
+    first_line = content.partition("\n")[0]
     return _detect_shebang(first_line) or _detect_json(content) or _detect_by_markers(content)
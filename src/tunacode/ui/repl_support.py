@@ -7,6 +7,7 @@ while hosting small, testable helpers and callback builders.
 from __future__ import annotations
 
 import re
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
@@ -157,13 +158,11 @@ def _extract_tool_result_text(result: ToolResult | None) -> str | None:
     if result is None:
         return None
 
-    parts: list[str] = []
-    for item in result.content:
-        if not isinstance(item, TextContent):
-            continue
-        if isinstance(item.text, str):
-            parts.append(item.text)
-
+    parts = [
+        item.text
+        for item in result.content
+        if isinstance(item, TextContent) and isinstance(item.text, str)
+    ]
     return "".join(parts) if parts else None
 
 
@@ -192,7 +191,7 @@ def build_tool_result_callback(app: AppForCallbacks) -> ToolResultCallback:
 
         app.post_message(
             ToolResultDisplay(
-                tool_name=tool_name,
+                tool_name=sys.intern(tool_name),
                 status=status,
                 args=args,
                 result=result,
@@ -388,6 +388,11 @@ class RequestDebugTracer:
         self._pending_input_probe = probe
         self._app.call_after_refresh(lambda probe=probe: self._complete_input_probe(probe))
 
+    @property
+    def is_tracing_request(self) -> bool:
+        """Whether per-request timings are being collected right now."""
+        return self._active_request_metrics is not None and self._enabled
+
     @property
     def _delta_flush_interval_s(self) -> float:
         return self._app.STREAM_THROTTLE_MS / self._app.MILLISECONDS_PER_SECOND
@@ -26,6 +26,17 @@ SHELL_CANCEL_SIGNAL = signal.SIGINT
 SHELL_OUTPUT_EMPTY = "(no output)"
 SHELL_STDERR_EMPTY = "(no errors)"
 
+# Result body handed to the bash renderer
+SHELL_RESULT_TEMPLATE = """Command: {cmd}
+Exit Code: {exit_code}
+Working Directory: {cwd}
+
+STDOUT:
+{stdout}
+
+STDERR:
+{stderr}"""
+
 # Error handler defaults
 SHELL_ERROR_CMD_PLACEHOLDER = "(shell error)"
 
@@ -146,15 +157,13 @@ class ShellRunner:
         stdout_text = stdout if stdout else SHELL_OUTPUT_EMPTY
         stderr_text = stderr if stderr else SHELL_STDERR_EMPTY
 
-        result_text = f"""Command: {cmd}
-Exit Code: {exit_code}
-Working Directory: {cwd}
-
-STDOUT:
-{stdout_text}
-
-STDERR:
-{stderr_text}"""
+        result_text = SHELL_RESULT_TEMPLATE.format(
+            cmd=cmd,
+            exit_code=exit_code,
+            cwd=cwd,
+            stdout=stdout_text,
+            stderr=stderr_text,
+        )
 
         args = {"timeout": int(SHELL_COMMAND_TIMEOUT_SECONDS)}
         rendered_panel = render_bash(args, result_text, duration_ms, max_line_width)
@@ -5,6 +5,8 @@ from __future__ import annotations
 import time
 from typing import TYPE_CHECKING
 
+from tunacode.ui.renderers.thinking import render_thinking_panel
+
 if TYPE_CHECKING:
     from textual.widgets import Static
 
@@ -80,8 +82,6 @@ class ThinkingState:
         if not force and elapsed_ms < self._throttle_ms():
             return
 
-        from tunacode.ui.renderers.thinking import render_thinking_panel
-
         self._last_update = now
         content, meta = render_thinking_panel(
             self._text,
@@ -111,8 +111,6 @@ class ThinkingState:
             self.hide()
             return
 
-        from tunacode.ui.renderers.thinking import render_thinking_panel
-
         content, meta = render_thinking_panel(
             self._text,
             max_lines=self._app.THINKING_MAX_RENDER_LINES,
@@ -10,6 +10,7 @@ from __future__ import annotations
 import sys
 from dataclasses import dataclass
 from itertools import islice
+from typing import cast
 
 from rich.console import RenderableType
 from rich.segment import Segment
@@ -207,8 +208,8 @@ class CopyOnSelectStatic(Static):
         cache_key = "_render.visual"
         cached = self._layout_cache.get(cache_key, None)
         if cached is not None:
-            assert isinstance(cached, Visual)
-            return cached
+            # Only Visuals are stored under this key (here and in Widget._render).
+            return cast(Visual, cached)
         visual = visualize(self, self.render(), markup=self._render_markup)
         if isinstance(visual, RichVisual) and not isinstance(visual, SelectableRichVisual):
             visual = SelectableRichVisual(self, visual._renderable)
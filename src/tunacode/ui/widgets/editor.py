@@ -64,6 +64,7 @@ class Editor(Input):
         self._placeholder_cleared: bool = False
         self._was_pasted: bool = False
         self._pasted_content: str = ""
+        self._paste_summary: str | None = None
         self._paste_after_typed_text: bool = False
         self._wrap_cache: _WrappedEditorState | None = None
         self._wrap_cache_key: tuple[object, ...] | None = None
@@ -76,11 +77,11 @@ class Editor(Input):
     def paste_summary(self) -> str | None:
         if not self.has_paste_buffer:
             return None
-        line_count = max(1, len(self._pasted_content.splitlines()))
+        return self._paste_summary
+
+    def _format_paste_summary(self, *, line_count: int, char_count: int) -> str:
         if line_count > 1:
             return self.PASTE_INDICATOR_LINES_TEMPLATE.format(line_count=line_count)
-
-        char_count = len(self._pasted_content)
         return self.PASTE_INDICATOR_CHARS_TEMPLATE.format(char_count=char_count)
 
     def on_key(self, event: events.Key) -> None:
@@ -149,6 +150,11 @@ class Editor(Input):
 
         self._was_pasted = True
         self._pasted_content = event.text
+        # Summarize once here; the indicator is re-rendered on every keystroke.
+        self._paste_summary = self._format_paste_summary(
+            line_count=line_count,
+            char_count=len(event.text),
+        )
         self._paste_after_typed_text = bool(self.value.strip())
 
         if paste_summary := self.paste_summary:
@@ -182,6 +188,7 @@ class Editor(Input):
         previous_summary = self.paste_summary
         self._was_pasted = False
         self._pasted_content = ""
+        self._paste_summary = None
         self._paste_after_typed_text = False
 
         if previous_summary and self.placeholder == previous_summary:
@@ -6,6 +6,7 @@ from tunacode.utils.messaging.adapter import (  # noqa: F401
     from_canonical,
     from_canonical_list,
     get_content,
+    get_content_length,
     get_tool_call_ids,
     get_tool_return_ids,
     to_canonical,
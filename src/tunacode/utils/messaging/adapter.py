@@ -6,7 +6,7 @@ JSON dictionaries at persistence boundaries.
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Iterator, Sequence
 from typing import Any, TypeAlias, cast
 
 from tinyagent.agent_types import AgentMessage, JsonObject
@@ -90,26 +90,26 @@ def _coerce_image_item(item: dict[str, Any]) -> str:
     return DEFAULT_IMAGE_PLACEHOLDER
 
 
-def _content_items_to_text(content_items: list[Any]) -> str:
-    segments: list[str] = []
+_CONTENT_SEGMENT_READERS: dict[str, Callable[[dict[str, Any]], str]] = {
+    CONTENT_TYPE_TEXT: _coerce_text_item,
+    CONTENT_TYPE_THINKING: _coerce_thinking_item,
+    CONTENT_TYPE_IMAGE: _coerce_image_item,
+}
+
 
+def _iter_content_segments(content_items: list[Any]) -> Iterator[str]:
     for raw_item in content_items:
         if raw_item is None:
             continue
 
         item = _coerce_content_item(raw_item)
         item_type = item.get(KEY_TYPE)
+        if not isinstance(item_type, str):
+            raise ValueError(f"Unsupported content item type: {item_type!r}")
 
-        if item_type == CONTENT_TYPE_TEXT:
-            segments.append(_coerce_text_item(item))
-            continue
-
-        if item_type == CONTENT_TYPE_THINKING:
-            segments.append(_coerce_thinking_item(item))
-            continue
-
-        if item_type == CONTENT_TYPE_IMAGE:
-            segments.append(_coerce_image_item(item))
+        read_segment = _CONTENT_SEGMENT_READERS.get(item_type)
+        if read_segment is not None:
+            yield read_segment(item)
             continue
 
         if item_type == CONTENT_TYPE_TOOL_CALL:
@@ -117,7 +117,19 @@ def _content_items_to_text(content_items: list[Any]) -> str:
 
         raise ValueError(f"Unsupported content item type: {item_type!r}")
 
-    return " ".join(segments)
+
+def _content_items_to_text(content_items: list[Any]) -> str:
+    return " ".join(_iter_content_segments(content_items))
+
+
+def _content_items_text_length(content_items: list[Any]) -> int:
+    total_length = 0
+    segment_count = 0
+    for segment in _iter_content_segments(content_items):
+        total_length += len(segment)
+        segment_count += 1
+    # Account for the single-space joiner used by _content_items_to_text.
+    return total_length + max(segment_count - 1, 0)
 
 
 def _validate_role(role: str) -> None:
@@ -162,23 +174,40 @@ def get_content(message: MESSAGE_INPUT) -> str:
     return _content_items_to_text(_coerce_content_items(msg))
 
 
-def get_tool_call_ids(message: MESSAGE_INPUT) -> set[str]:
-    """Return tool call IDs present in an assistant message."""
+def get_content_length(message: MESSAGE_INPUT) -> int:
+    """Return len(get_content(message)) without building the joined text."""
 
     msg = _coerce_agent_message_dict(message)
-    if _coerce_role(msg) != ROLE_ASSISTANT:
-        return set()
+    role = _coerce_role(msg)
+    _validate_role(role)
+    return _content_items_text_length(_coerce_content_items(msg))
 
-    call_ids: set[str] = set()
-    for raw_item in _coerce_content_items(msg):
+
+def _iter_tool_call_ids(message: dict[str, Any]) -> Iterator[str]:
+    for raw_item in _coerce_content_items(message):
         item = _coerce_content_item(raw_item)
         if item.get(KEY_TYPE) != CONTENT_TYPE_TOOL_CALL:
             continue
         tool_call_id = item.get(KEY_ID)
         if isinstance(tool_call_id, str) and tool_call_id:
-            call_ids.add(tool_call_id)
+            yield tool_call_id
+
+
+def _tool_return_id(message: dict[str, Any]) -> str | None:
+    tool_call_id = message.get(KEY_TOOL_CALL_ID)
+    if isinstance(tool_call_id, str) and tool_call_id:
+        return tool_call_id
+    return None
+
+
+def get_tool_call_ids(message: MESSAGE_INPUT) -> set[str]:
+    """Return tool call IDs present in an assistant message."""
+
+    msg = _coerce_agent_message_dict(message)
+    if _coerce_role(msg) != ROLE_ASSISTANT:
+        return set()
 
-    return call_ids
+    return set(_iter_tool_call_ids(msg))
 
 
 def get_tool_return_ids(message: MESSAGE_INPUT) -> set[str]:
@@ -188,11 +217,10 @@ def get_tool_return_ids(message: MESSAGE_INPUT) -> set[str]:
     if _coerce_role(msg) not in TOOL_ROLES:
         return set()
 
-    tool_call_id = msg.get(KEY_TOOL_CALL_ID)
-    if isinstance(tool_call_id, str) and tool_call_id:
-        return {tool_call_id}
-
-    return set()
+    tool_call_id = _tool_return_id(msg)
+    if tool_call_id is None:
+        return set()
+    return {tool_call_id}
 
 
 def find_dangling_tool_calls(messages: Sequence[MESSAGE_INPUT]) -> set[str]:
@@ -201,8 +229,15 @@ def find_dangling_tool_calls(messages: Sequence[MESSAGE_INPUT]) -> set[str]:
     call_ids: set[str] = set()
     return_ids: set[str] = set()
 
-    for msg in messages:
-        call_ids.update(get_tool_call_ids(msg))
-        return_ids.update(get_tool_return_ids(msg))
+    for message in messages:
+        # Coerce and classify each message once; model_dump() dominates the scan.
+        msg = _coerce_agent_message_dict(message)
+        role = _coerce_role(msg)
+        if role == ROLE_ASSISTANT:
+            call_ids.update(_iter_tool_call_ids(msg))
+        elif role in TOOL_ROLES:
+            tool_call_id = _tool_return_id(msg)
+            if tool_call_id is not None:
+                return_ids.add(tool_call_id)
 
     return call_ids - return_ids
@@ -17,7 +17,7 @@ from typing import TypeAlias
 
 from tinyagent.agent_types import AgentMessage, JsonObject
 
-from tunacode.utils.messaging.adapter import get_content
+from tunacode.utils.messaging.adapter import get_content_length
 
 CHARS_PER_TOKEN: int = 4
 MessageInput: TypeAlias = AgentMessage | JsonObject
@@ -37,7 +37,7 @@ def estimate_message_tokens(message: MessageInput) -> int:
     budgeting and compaction heuristics, not billing-accurate accounting.
     """
 
-    return estimate_tokens(get_content(message))
+    return get_content_length(message) // CHARS_PER_TOKEN
 
 
 def estimate_messages_tokens(messages: Sequence[MessageInput]) -> int:
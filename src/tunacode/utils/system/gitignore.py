@@ -20,7 +20,7 @@ from tunacode.configuration.ignore_patterns import (
 
 
 def _is_fast_excluded(relative_path: Path) -> bool:
-    return any(part in DEFAULT_EXCLUDE_DIRS for part in relative_path.parts)
+    return not DEFAULT_EXCLUDE_DIRS.isdisjoint(relative_path.parts)
 
 
 def _matches_ignored_path(relative_path: Path, spec: pathspec.PathSpec, is_dir: bool) -> bool:
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from tunacode.configuration.ignore_patterns import (
     DEFAULT_IGNORE_PATTERNS,
+    compile_ignore_regex,
     compile_ignore_spec,
     merge_ignore_patterns,
     read_ignore_file_lines,
@@ -25,6 +26,87 @@ def test_compile_ignore_spec_combines_defaults_and_gitignore_lines(tmp_path: Pat
     assert spec.match_file("src/app.py") is False
 
 
+def test_compile_ignore_regex_matches_like_spec() -> None:
+    spec = compile_ignore_spec((*DEFAULT_IGNORE_PATTERNS, "generated.txt", "docs/**/*.md"))
+    regex = compile_ignore_regex(spec)
+
+    assert regex is not None
+    for path in (
+        ".venv/lib/python3.11/site.py",
+        "src/build/out.o",
+        "pkg/module.pyc",
+        "docs/guide/intro.md",
+        "generated.txt",
+        "src/app.py",
+        "docs.md",
+    ):
+        assert (regex.match(path) is not None) is spec.match_file(path)
+
+
+def test_compile_ignore_regex_agrees_with_spec_for_anchored_dir_and_globstar_patterns() -> None:
+    spec = compile_ignore_spec(
+        (
+            "/build",
+            "/dist/",
+            "out/",
+            "**/tmp",
+            "cache/**",
+            "a/**/b",
+            "**/node_modules/**",
+            "src/*.gen.py",
+            "file?.txt",
+            "[Tt]humbs.db",
+            "*.log",
+        )
+    )
+    regex = compile_ignore_regex(spec)
+
+    assert regex is not None
+    for path in (
+        "build",
+        "build/x.o",
+        "src/build",
+        "src/build/x.o",
+        "dist",
+        "dist/pkg.whl",
+        "src/dist/pkg.whl",
+        "out",
+        "out/result.json",
+        "src/out/result.json",
+        "output/result.json",
+        "tmp",
+        "tmp/scratch.txt",
+        "src/deep/tmp",
+        "src/deep/tmp/scratch.txt",
+        "tmpfile",
+        "cache",
+        "cache/a/b.bin",
+        "src/cache/a.bin",
+        "a/b",
+        "a/x/y/b",
+        "a/x/y/b/c.txt",
+        "a/bc",
+        "node_modules/pkg/index.js",
+        "web/node_modules/pkg/index.js",
+        "src/api.gen.py",
+        "src/sub/api.gen.py",
+        "file1.txt",
+        "file10.txt",
+        "thumbs.db",
+        "Thumbs.db",
+        "logs/app.log",
+        "app.logger",
+        "src/app.py",
+    ):
+        assert (regex.match(path) is not None) is spec.match_file(path), path
+
+
+def test_compile_ignore_regex_defers_negated_patterns_to_spec() -> None:
+    spec = compile_ignore_spec(("*.log", "!keep.log"))
+
+    assert compile_ignore_regex(spec) is None
+
+
 def test_read_ignore_file_lines_returns_empty_tuple_for_invalid_utf8(tmp_path: Path) -> None:
     gitignore_path = tmp_path / ".gitignore"
     gitignore_path.write_bytes(b"\xff\xfeignored\n")
@@ -6,12 +6,24 @@ from pathlib import Path
 
 from tinyagent.agent import Agent
 
+from tunacode.types import ModelPricing
+
 from tunacode.tools.cache_accessors.ignore_manager_cache import (
     clear_ignore_manager_cache,
     get_ignore_manager,
 )
 
 from tunacode.infrastructure.cache.caches.agents import clear_agents, get_agent, set_agent
+from tunacode.infrastructure.cache.caches.model_pricing import (
+    clear_model_pricing_cache,
+    set_model_pricing,
+    try_get_model_pricing,
+)
+from tunacode.infrastructure.cache.caches.system_prompt import (
+    clear_system_prompt_cache,
+    get_system_prompt,
+    set_system_prompt,
+)
 from tunacode.infrastructure.cache.caches.tunacode_context import (
     clear_context_cache,
     get_context,
@@ -55,6 +67,24 @@ def test_tunacode_context_accessor_is_mtime_aware(tmp_path: Path) -> None:
     assert "hello again" in third
 
 
+def test_system_prompt_accessor_is_mtime_aware(tmp_path: Path) -> None:
+    clear_system_prompt_cache()
+
+    prompt_path = tmp_path / "system_prompt.md"
+    prompt_path.write_text("prompt v1\n")
+
+    assert get_system_prompt(prompt_path) is None
+    set_system_prompt(prompt_path, "prompt v1\n")
+    assert get_system_prompt(prompt_path) == "prompt v1\n"
+
+    original_mtime_ns = os.stat(prompt_path).st_mtime_ns
+    prompt_path.write_text("prompt v2\n")
+    new_mtime_ns = original_mtime_ns + 1_000_000_000
+    os.utime(prompt_path, ns=(new_mtime_ns, new_mtime_ns))
+
+    assert get_system_prompt(prompt_path) is None
+
+
 def test_ignore_manager_accessor_is_mtime_aware(tmp_path: Path) -> None:
     clear_ignore_manager_cache()
 
@@ -70,3 +100,19 @@ def test_ignore_manager_accessor_is_mtime_aware(tmp_path: Path) -> None:
 
     third = get_ignore_manager(tmp_path)
     assert third is not second
+
+
+def test_model_pricing_accessor_distinguishes_miss_from_no_pricing() -> None:
+    clear_model_pricing_cache()
+
+    assert try_get_model_pricing("provider:priced") == (False, None)
+
+    pricing = ModelPricing(input=1.0, cached_input=0.5, output=2.0)
+    set_model_pricing("provider:priced", pricing)
+    set_model_pricing("provider:unpriced", None)
+
+    assert try_get_model_pricing("provider:priced") == (True, pricing)
+    assert try_get_model_pricing("provider:unpriced") == (True, None)
+
+    clear_model_pricing_cache()
+    assert try_get_model_pricing("provider:unpriced") == (False, None)
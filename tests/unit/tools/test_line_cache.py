@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+
+from tunacode.tools import line_cache
+from tunacode.tools.hashline import HashedLine, content_hash
+
+
+@pytest.fixture(autouse=True)
+def _clear_line_cache() -> Iterator[None]:
+    line_cache.clear()
+    yield
+    line_cache.clear()
+
+
+def _store_file(filepath: str) -> None:
+    line_cache.store(
+        filepath,
+        [HashedLine(line_number=1, hash=content_hash(filepath), content=filepath)],
+    )
+
+
+def test_store_evicts_least_recently_used_file_past_limit() -> None:
+    for index in range(line_cache.MAX_CACHED_FILES + 1):
+        _store_file(f"file-{index}.py")
+
+    cached = line_cache.cached_files()
+    assert len(cached) == line_cache.MAX_CACHED_FILES
+    assert "file-0.py" not in cached
+    assert line_cache.get("file-0.py") is None
+    assert line_cache.get(f"file-{line_cache.MAX_CACHED_FILES}.py") is not None
+
+
+def test_get_refreshes_file_recency() -> None:
+    for index in range(line_cache.MAX_CACHED_FILES):
+        _store_file(f"file-{index}.py")
+
+    assert line_cache.get("file-0.py") is not None
+    _store_file("file-new.py")
+
+    cached = line_cache.cached_files()
+    assert "file-0.py" in cached
+    assert "file-1.py" not in cached
+    assert line_cache.validate_ref("file-0.py", 1, content_hash("file-0.py"))
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.screen import Screen
+from textual.selection import SELECT_ALL
+from textual.widgets import Static
+
+from tunacode.ui import clipboard
+
+
+class _PushedScreen(Screen[None]):
+    def compose(self) -> ComposeResult:
+        yield Static("pushed screen text", id="pushed-text")
+
+
+class _ClipboardApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield Static("default screen text", id="default-text")
+
+
+@pytest.mark.asyncio
+async def test_copy_selection_reads_selection_on_pushed_screen(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    copied: list[str] = []
+    monkeypatch.setattr(clipboard, "_copy_to_clipboard", copied.append)
+    app = _ClipboardApp()
+
+    async with app.run_test() as pilot:
+        screen = _PushedScreen()
+        await app.push_screen(screen)
+        await pilot.pause()
+
+        pushed_text = screen.query_one("#pushed-text", Static)
+        screen.selections = {pushed_text: SELECT_ALL}
+        await pilot.pause()
+
+        result = clipboard.copy_selection_to_clipboard(app, show_toast=False)
+
+    assert result == "pushed screen text"
+    assert copied == ["pushed screen text"]
+
+
+@pytest.mark.asyncio
+async def test_copy_selection_returns_none_without_selection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    copied: list[str] = []
+    monkeypatch.setattr(clipboard, "_copy_to_clipboard", copied.append)
+    app = _ClipboardApp()
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        result = clipboard.copy_selection_to_clipboard(app, show_toast=False)
+
+    assert result is None
+    assert copied == []